@@ -7,6 +7,7 @@ Demonstrates how to use scenario_forge to generate a scenario,
 print its narrative and risk summary, and export to JSON.
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -24,6 +25,14 @@ from scenario_forge import (
 
 def main():
     """Generate a scenario and demonstrate usage"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--no-narrative',
+        action='store_true',
+        help="Omit the narrative from the JSON export"
+    )
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("scenario_forge: Example Usage")
     print("=" * 80)
@@ -83,7 +92,7 @@ def main():
     print("=" * 80)
     print("Exporting Scenario")
     print("=" * 80)
-    export_json(scenario, json_path)
+    export_json(scenario, json_path, include_narrative=not args.no_narrative)
     print(f"  ✅ JSON exported to: {json_path}")
     
     export_csv_transactions(scenario, csv_path)
@@ -9,22 +9,30 @@ for demos and model evaluation. This is a controlled adversarial scenario compil
 For internal testing and demos only, not for production use.
 """
 
-from .scenario import Scenario, ScenarioIntent
+from .scenario import EdgeRow, Scenario, ScenarioIntent
 from .primitives import (
     Wallet, Transaction, Asset, Chain, ChainType,
-    Jurisdiction, RegulatoryTier
+    Jurisdiction, RegulatoryTier, MotifKind
 )
 from .templates import (
     cross_chain_laundering,
     mixer_ransomware_liquidation,
     sanctions_evasion_jurisdiction_hopping,
     nft_wash_trading_extraction,
-    false_positive_legitimate_pattern
+    false_positive_legitimate_pattern,
+    TemplateSpec,
+    MotifStep,
+    TEMPLATES,
+    build_template,
+    build_batch,
+    iter_batch
 )
 from .exporters import (
     export_json,
     export_csv_transactions,
-    export_markdown_narrative
+    export_markdown_narrative,
+    export_many,
+    to_arrow_table
 )
 from .narrative import generate_narrative
 from .motifs import (
@@ -34,7 +42,11 @@ from .motifs import (
     MixerObfuscation,
     NFTWashTrading,
     DormancyCooling,
-    FalsePositiveTrap
+    FalsePositiveTrap,
+    SubgraphContext,
+    TransactionColumns,
+    to_soa,
+    batch_generate
 )
 
 __version__ = "0.1.0"
@@ -42,6 +54,7 @@ __all__ = [
     # Core classes
     'Scenario',
     'ScenarioIntent',
+    'EdgeRow',
     'Wallet',
     'Transaction',
     'Asset',
@@ -49,16 +62,25 @@ __all__ = [
     'ChainType',
     'Jurisdiction',
     'RegulatoryTier',
+    'MotifKind',
     # Templates
     'cross_chain_laundering',
     'mixer_ransomware_liquidation',
     'sanctions_evasion_jurisdiction_hopping',
     'nft_wash_trading_extraction',
     'false_positive_legitimate_pattern',
+    'TemplateSpec',
+    'MotifStep',
+    'TEMPLATES',
+    'build_template',
+    'build_batch',
+    'iter_batch',
     # Exporters
     'export_json',
     'export_csv_transactions',
     'export_markdown_narrative',
+    'export_many',
+    'to_arrow_table',
     # Narrative
     'generate_narrative',
     # Motifs
@@ -69,5 +91,9 @@ __all__ = [
     'NFTWashTrading',
     'DormancyCooling',
     'FalsePositiveTrap',
+    'SubgraphContext',
+    'TransactionColumns',
+    'to_soa',
+    'batch_generate',
 ]
 
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Specialized Canonical Serializer
+
+Emits canonical JSON for the fixed scenario integrity payload built by
+`Scenario.compute_integrity_hash`. Keys are written in their pre-sorted
+order, so no per-dict key sort is needed. Output is byte-identical to
+`crypto.canonical_json_bytes` for the same payload.
+"""
+
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Optional
+
+# Top-level keys of the integrity payload
+SCENARIO_PAYLOAD_KEYS = frozenset({
+    'aml_weaknesses', 'created_at', 'entity_roles', 'intent',
+    'jurisdiction_assumptions', 'motifs_used', 'scenario_id',
+    'transaction_count', 'transactions'
+})
+
+# Keys of each entry in the payload's jurisdiction and transaction lists
+JURISDICTION_KEYS = frozenset({'code', 'name', 'tier'})
+TRANSACTION_KEYS = frozenset({'amount', 'asset', 'from', 'timestamp', 'to', 'tx_id'})
+
+# Sequence types json serializes as arrays
+_SEQUENCE_TYPES = (list, tuple)
+
+
+def _str_list(values) -> str:
+    """Encode a list of strings"""
+    return '[' + ','.join([encode_basestring_ascii(v) for v in values]) + ']'
+
+
+def serialize_scenario_canonical(data: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Serialize a scenario integrity payload to canonical JSON bytes.
+    
+    Args:
+        data: Payload with exactly `SCENARIO_PAYLOAD_KEYS`, whose jurisdiction
+            and transaction entries have exactly `JURISDICTION_KEYS` and
+            `TRANSACTION_KEYS`, and whose values are strings (plus the int
+            transaction count)
+    
+    Returns:
+        Canonical ASCII JSON, or None if the payload does not match the
+        expected schema (callers then use the generic serializer)
+    """
+    if data.keys() != SCENARIO_PAYLOAD_KEYS or type(data['transaction_count']) is not int:
+        return None
+    
+    # Anything the templates below would drop, reorder or misencode (extra
+    # or missing nested keys, non-list sequences, non-dict entries) falls
+    # back to the generic serializer
+    if type(data['entity_roles']) is not dict:
+        return None
+    for key in ('aml_weaknesses', 'jurisdiction_assumptions', 'motifs_used', 'transactions'):
+        if type(data[key]) not in _SEQUENCE_TYPES:
+            return None
+    for j in data['jurisdiction_assumptions']:
+        if type(j) is not dict or j.keys() != JURISDICTION_KEYS:
+            return None
+    for t in data['transactions']:
+        if type(t) is not dict or t.keys() != TRANSACTION_KEYS:
+            return None
+    
+    enc = encode_basestring_ascii
+    roles = data['entity_roles']
+    try:
+        parts = [
+            '{"aml_weaknesses":', _str_list(data['aml_weaknesses']),
+            ',"created_at":', enc(data['created_at']),
+            ',"entity_roles":{',
+            ','.join([enc(k) + ':' + enc(roles[k]) for k in sorted(roles)]),
+            '},"intent":', enc(data['intent']),
+            ',"jurisdiction_assumptions":[',
+            ','.join([
+                '{"code":' + enc(j['code']) + ',"name":' + enc(j['name']) + ',"tier":' + enc(j['tier']) + '}'
+                for j in data['jurisdiction_assumptions']
+            ]),
+            '],"motifs_used":', _str_list(data['motifs_used']),
+            ',"scenario_id":', enc(data['scenario_id']),
+            ',"transaction_count":', str(data['transaction_count']),
+            ',"transactions":[',
+            ','.join([
+                '{"amount":' + enc(t['amount'])
+                + ',"asset":' + enc(t['asset'])
+                + ',"from":' + enc(t['from'])
+                + ',"timestamp":' + enc(t['timestamp'])
+                + ',"to":' + enc(t['to'])
+                + ',"tx_id":' + enc(t['tx_id']) + '}'
+                for t in data['transactions']
+            ]),
+            ']}'
+        ]
+    except TypeError:
+        # Non-string values or keys
+        return None
+    return ''.join(parts).encode('ascii')
@@ -2,48 +2,162 @@
 """
 Cryptographic Hashing Utilities
 
-Provides SHA-256 hashing with extension points for other algorithms.
+Provides SHA-256 hashing with extension points for other algorithms
+(BLAKE2b is available for high-volume transaction hashing, and BLAKE3 when
+the optional `blake3` package is installed).
+Canonical bytes are ASCII-escaped JSON as produced by the standard library
+json module (with a specialized serializer for the scenario integrity
+payload), so hashes match those recorded by earlier releases.
 """
 
 import hashlib
 import json
-from typing import Any, Dict
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable, Dict, List, Union
 
+from ._canonical import serialize_scenario_canonical
 
-def compute_scenario_hash(data: Dict[str, Any], algorithm: str = 'sha256') -> str:
+
+def _blake3(data: bytes) -> Any:
+    """Construct a BLAKE3 hasher (imported lazily; optional dependency)"""
+    try:
+        import blake3
+    except ImportError:
+        raise ImportError("algorithm='blake3' requires the optional 'blake3' package") from None
+    return blake3.blake3(data)
+
+
+# Hash constructors by algorithm name; every digest is 32 bytes
+_ALGOS: Dict[str, Callable[[bytes], Any]] = {
+    'sha256': hashlib.sha256,
+    'blake2b': partial(hashlib.blake2b, digest_size=32),
+    'blake3': _blake3,
+}
+
+# Supported hash algorithms
+SUPPORTED_ALGORITHMS = tuple(_ALGOS)
+
+# Prefixes marking non-default algorithms in stored scenario hashes; SHA-256
+# hashes stay unprefixed so previously recorded hashes remain comparable
+HASH_PREFIXES = {'blake2b': 'b2-', 'blake3': 'b3-'}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize scenario types that JSON does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def canonical_json_bytes(data: Dict[str, Any]) -> bytes:
     """
-    Compute cryptographic hash of scenario data.
+    Serialize data to canonical JSON bytes (sorted keys, no whitespace, ASCII).
     
-    Uses canonical JSON serialization (sorted keys, deterministic).
+    The format is part of every stored integrity hash: non-ASCII text is
+    escaped exactly as `json.dumps(..., sort_keys=True)` does. orjson is not
+    used here because it emits raw UTF-8 and formats floats differently.
     
     Args:
-        data: Dictionary to hash
-        algorithm: Hash algorithm (default: 'sha256', extension point for others)
+        data: Dictionary to serialize
     
     Returns:
-        Hexadecimal hash string
+        Canonical UTF-8 encoded JSON
     """
-    if algorithm != 'sha256':
-        raise ValueError(f"Only 'sha256' is currently supported, got: {algorithm}")
+    if isinstance(data, dict) and 'scenario_id' in data:
+        canonical = serialize_scenario_canonical(data)
+        if canonical is not None:
+            return canonical
+    return json.dumps(
+        data,
+        sort_keys=True,
+        separators=(',', ':'),
+        default=_json_default
+    ).encode('ascii')
+
+
+def _hash_canonical(canonical: bytes, algorithm: str = 'sha256') -> bytes:
+    """Hash canonical JSON bytes, returning the raw digest"""
+    return _ALGOS[algorithm](canonical).digest()
+
+
+def _check_algorithm(algorithm: str) -> None:
+    """Reject unsupported hash algorithms"""
+    if algorithm not in _ALGOS:
+        raise ValueError(f"Supported hash algorithms are {SUPPORTED_ALGORITHMS}, got: {algorithm}")
+
+
+def compute_scenario_hash(
+    data: Union[Dict[str, Any], bytes],
+    algorithm: str = 'sha256',
+    hexdigest: bool = True
+) -> Union[str, bytes]:
+    """
+    Compute cryptographic hash of scenario data.
+    
+    Uses canonical JSON serialization (sorted keys, deterministic).
     
-    # Canonical JSON serialization: sorted keys, no whitespace
-    canonical_json = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    Args:
+        data: Dictionary to hash, or bytes already produced by
+            `canonical_json_bytes` (hashed as-is)
+        algorithm: Hash algorithm (default: 'sha256'; 'blake2b' and 'blake3'
+            produce 32-byte digests)
+        hexdigest: Return a hex string (default); if False, return the raw
+            digest bytes, which are cheaper to compare
     
-    # Compute SHA-256 hash
-    hash_obj = hashlib.sha256(canonical_json.encode('utf-8'))
+    Returns:
+        Hexadecimal hash string, or raw digest bytes if hexdigest is False
+    """
+    _check_algorithm(algorithm)
     
-    return hash_obj.hexdigest()
+    canonical = data if isinstance(data, bytes) else canonical_json_bytes(data)
+    digest = _hash_canonical(canonical, algorithm)
+    return digest.hex() if hexdigest else digest
 
 
-def compute_transaction_hash(transaction_dict: Dict[str, Any]) -> str:
+def compute_transaction_hash(transaction_dict: Dict[str, Any], hexdigest: bool = True) -> Union[str, bytes]:
     """
     Compute hash of a transaction dictionary.
     
     Args:
         transaction_dict: Transaction data dictionary
+        hexdigest: Return a hex string (default) or raw digest bytes
     
     Returns:
-        Hexadecimal hash string
+        Hexadecimal hash string, or raw digest bytes if hexdigest is False
     """
-    return compute_scenario_hash(transaction_dict)
+    return compute_scenario_hash(transaction_dict, hexdigest=hexdigest)
+
 
+def compute_transaction_hashes_batch(
+    transaction_dicts: List[Dict[str, Any]],
+    algorithm: str = 'sha256',
+    hexdigest: bool = True
+) -> List[Union[str, bytes]]:
+    """
+    Compute hashes for many transaction dictionaries in one call.
+    
+    Validates the algorithm once and hashes in a tight loop. Use
+    algorithm='blake2b' for faster bulk integrity digests; scenario-level
+    hashes should stay on SHA-256 so they remain externally verifiable.
+    
+    Args:
+        transaction_dicts: Transaction data dictionaries
+        algorithm: Hash algorithm ('sha256', 'blake2b' or 'blake3')
+        hexdigest: Return hex strings (default) or raw digest bytes
+    
+    Returns:
+        List of hashes in input order
+    """
+    _check_algorithm(algorithm)
+    
+    digests = [
+        _hash_canonical(canonical_json_bytes(tx_dict), algorithm)
+        for tx_dict in transaction_dicts
+    ]
+    if hexdigest:
+        return [digest.hex() for digest in digests]
+    return digests
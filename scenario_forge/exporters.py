@@ -2,38 +2,135 @@
 """
 Exporters
 
-Export scenarios to JSON, CSV, and Markdown formats with governance metadata.
+Export scenarios to JSON, CSV, and Markdown formats with governance metadata,
+and to an Arrow table when the optional `pyarrow` package is installed.
 """
 
 import csv
 import json
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .scenario import Scenario
 from .narrative import generate_narrative
+from .crypto import _json_default
+
+# Buffer size for export writes (1 MiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Column order for transaction CSV exports
+_CSV_FIELDNAMES = (
+    'tx_id', 'from_address', 'to_address', 'asset_symbol',
+    'amount', 'fee', 'timestamp', 'block_number',
+    'from_role', 'to_role'
+)
+
+# Column order for Arrow transaction tables (CSV columns plus scenario header)
+_ARROW_FIELDNAMES = (
+    'scenario_id', 'intent', 'scenario_hash',
+    'tx_id', 'from_address', 'to_address', 'asset_symbol', 'chain',
+    'amount', 'fee', 'timestamp', 'block_number',
+    'from_role', 'to_role'
+)
+
+# Governance footer appended to Markdown narrative exports
+_MD_FOOTER_TEMPLATE = (
+    "\n\n"
+    "---\n\n"
+    "## Export Metadata\n\n"
+    "- **Export Format:** Markdown Narrative\n"
+    "- **Scenario ID:** `{scenario_id}`\n"
+    "- **Integrity Hash:** `{scenario_hash}`\n"
+    "- **Export Timestamp:** {created_at}\n"
+    "\n"
+    "⚠️ **WARNING:** ARTIFICIAL_DATA_DO_NOT_USE_FOR_REAL_CASES\n"
+)
+
+
+def _orjson_compatible(obj: Any) -> bool:
+    """
+    Check that orjson would serialize obj exactly as json does.
+    
+    True only for str, bool, None, 64-bit ints, and lists/tuples/dicts (with
+    str keys) of those. Floats are excluded because orjson formats exponents
+    differently (1e16 vs 1e+16) and writes NaN as null.
+    """
+    t = type(obj)
+    if t is str or t is bool or obj is None:
+        return True
+    if t is int:
+        return -(1 << 63) <= obj < (1 << 64)
+    if t is dict:
+        for key, value in obj.items():
+            if type(key) is not str or not _orjson_compatible(value):
+                return False
+        return True
+    if t is list or t is tuple:
+        for value in obj:
+            if not _orjson_compatible(value):
+                return False
+        return True
+    return False
+
+
+def _dumps_json(data: Dict, indent: Optional[int]) -> bytes:
+    """
+    Serialize an export dict to UTF-8 JSON bytes.
+    
+    Uses orjson when it is installed and the data holds only types it
+    renders identically to json; otherwise (or if orjson rejects the data)
+    uses json. The bytes therefore do not depend on whether orjson is
+    installed.
+    """
+    if orjson is not None and indent in (2, None) and _orjson_compatible(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent == 2 else 0)
+        except orjson.JSONEncodeError:
+            pass
+    if indent is None:
+        text = json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(data, indent=indent, ensure_ascii=False, default=_json_default)
+    return text.encode('utf-8')
 
 
-def export_json(scenario: Scenario, path: Path) -> None:
+def export_json(
+    scenario: Scenario,
+    path: Path,
+    *,
+    include_narrative: bool = True,
+    indent: Optional[int] = 2
+) -> None:
     """
     Export scenario to JSON format.
     
     Args:
         scenario: Scenario to export
         path: Output file path
+        include_narrative: Embed the Markdown narrative (default: True); machine
+            pipelines that do not read it can skip rendering
+        indent: Indentation width, or None for compact output
     """
-    scenario_dict = scenario.to_dict()
+    scenario_dict = scenario.to_dict_cached()
     
-    # Add narrative to export
-    from .narrative import generate_narrative
-    scenario_dict['narrative'] = generate_narrative(scenario)
+    # Add narrative to export (to_dict_cached returns a new dict every call)
+    if include_narrative:
+        scenario_dict['narrative'] = generate_narrative(scenario)
     
     # Ensure directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Write JSON
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(scenario_dict, f, indent=2, ensure_ascii=False)
+    # Serialize in one pass and write once
+    payload = _dumps_json(scenario_dict, indent)
+    
+    with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
     
     # Prepend warning as comment (JSON doesn't support comments, so add to metadata)
     # The warning is already in the dictionary, so we're good
@@ -50,54 +147,51 @@ def export_csv_transactions(scenario: Scenario, path: Path) -> None:
     # Ensure directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Collect transactions
-    transactions = []
-    for from_addr, to_addr, data in scenario.transaction_graph.edges(data=True):
-        tx = data['transaction']
-        transactions.append({
-            'tx_id': tx.tx_id,
-            'from_address': from_addr,
-            'to_address': to_addr,
-            'asset_symbol': tx.asset.symbol,
-            'amount': str(tx.amount),
-            'fee': str(tx.fee),
-            'timestamp': tx.timestamp.isoformat(),
-            'block_number': tx.block_number,
-            'from_role': scenario.entity_roles.get(from_addr, 'unknown'),
-            'to_role': scenario.entity_roles.get(to_addr, 'unknown')
-        })
-    
-    # Sort by timestamp
-    transactions.sort(key=lambda x: x['timestamp'])
+    # Governance metadata row, derived once from the scenario header
+    metadata_row = (
+        'METADATA',
+        'ARTIFICIAL_DATA_DO_NOT_USE_FOR_REAL_CASES',
+        f"Intent: {scenario.intent.value}",
+        f"Scenario ID: {scenario.scenario_id}",
+        f"Created: {scenario.created_at.isoformat()}",
+        f"Hash: {scenario.scenario_hash}",
+        '', '', '', ''
+    )
+    
+    # Edges pre-sorted by timestamp (stable for ties) on the scenario, split
+    # into columns so each pass below is flat
+    rows = list(scenario.iter_edge_rows())
+    txs = [row.transaction for row in rows]
+    from_addrs = [row.from_address for row in rows]
+    to_addrs = [row.to_address for row in rows]
+    
+    # Resolve each node's role once; edges only reference scenario nodes
+    entity_roles = scenario.entity_roles
+    roles = {addr: entity_roles.get(addr, 'unknown') for addr in scenario.nodes}
+    
+    transactions = list(zip(
+        [tx.tx_id for tx in txs],
+        from_addrs,
+        to_addrs,
+        [tx.asset.symbol for tx in txs],
+        [row.amount for row in rows],
+        [str(tx.fee) for tx in txs],
+        [row.timestamp_str for row in rows],
+        [tx.block_number for tx in txs],
+        [roles[addr] for addr in from_addrs],
+        [roles[addr] for addr in to_addrs]
+    ))
     
     # Write CSV
-    with open(path, 'w', newline='', encoding='utf-8') as f:
+    with open(path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
         if not transactions:
             return
         
-        fieldnames = [
-            'tx_id', 'from_address', 'to_address', 'asset_symbol',
-            'amount', 'fee', 'timestamp', 'block_number',
-            'from_role', 'to_role'
-        ]
-        
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(_CSV_FIELDNAMES)
         
         # Write metadata as first data row (with special marker)
-        writer.writerow({
-            'tx_id': 'METADATA',
-            'from_address': 'ARTIFICIAL_DATA_DO_NOT_USE_FOR_REAL_CASES',
-            'to_address': f"Intent: {scenario.intent.value}",
-            'asset_symbol': f"Scenario ID: {scenario.scenario_id}",
-            'amount': f"Created: {scenario.created_at.isoformat()}",
-            'fee': f"Hash: {scenario.scenario_hash}",
-            'timestamp': '',
-            'block_number': '',
-            'from_role': '',
-            'to_role': ''
-        })
-        
+        writer.writerow(metadata_row)
         writer.writerows(transactions)
 
 
@@ -112,19 +206,139 @@ def export_markdown_narrative(scenario: Scenario, path: Path) -> None:
     # Ensure directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Generate narrative
-    narrative = generate_narrative(scenario)
-    
-    # Write markdown
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(narrative)
-        f.write('\n\n')
-        f.write('---\n\n')
-        f.write('## Export Metadata\n\n')
-        f.write(f'- **Export Format:** Markdown Narrative\n')
-        f.write(f'- **Scenario ID:** `{scenario.scenario_id}`\n')
-        f.write(f'- **Integrity Hash:** `{scenario.scenario_hash}`\n')
-        f.write(f'- **Export Timestamp:** {scenario.created_at.isoformat()}\n')
-        f.write('\n')
-        f.write('⚠️ **WARNING:** ARTIFICIAL_DATA_DO_NOT_USE_FOR_REAL_CASES\n')
+    # Generate narrative and append the footer in a single write
+    document = generate_narrative(scenario) + _MD_FOOTER_TEMPLATE.format_map({
+        'scenario_id': scenario.scenario_id,
+        'scenario_hash': scenario.scenario_hash,
+        'created_at': scenario.created_at.isoformat()
+    })
+    
+    with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(document.encode('utf-8'))
+
 
+def _pyarrow() -> Any:
+    """Import pyarrow (imported lazily; optional dependency)"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("to_arrow_table requires the optional 'pyarrow' package") from None
+    return pyarrow
+
+
+def to_arrow_table(scenarios: Iterable[Scenario]) -> Any:
+    """
+    Collect the transactions of many scenarios into one Arrow table.
+    
+    One row per transaction edge, in each scenario's timestamp order, with
+    the CSV columns plus the scenario id, intent, hash and chain. Columns are
+    gathered as flat lists and converted once per column, so analytics tools
+    (pandas, Polars, DuckDB) can consume the table without per-row Python
+    objects. Amounts and fees are exact decimal strings, as in the CSV
+    export. The artificial-data warning is stored in the schema metadata.
+    
+    Args:
+        scenarios: Scenarios to include (e.g. from `build_batch`)
+    
+    Returns:
+        pyarrow.Table with the `_ARROW_FIELDNAMES` columns
+    """
+    pa = _pyarrow()
+    columns: Dict[str, List] = {name: [] for name in _ARROW_FIELDNAMES}
+    
+    for scenario in scenarios:
+        rows = list(scenario.iter_edge_rows())
+        n = len(rows)
+        txs = [row.transaction for row in rows]
+        from_addrs = [row.from_address for row in rows]
+        to_addrs = [row.to_address for row in rows]
+        
+        entity_roles = scenario.entity_roles
+        roles = {addr: entity_roles.get(addr, 'unknown') for addr in scenario.nodes}
+        
+        columns['scenario_id'] += [scenario.scenario_id] * n
+        columns['intent'] += [scenario.intent.value] * n
+        columns['scenario_hash'] += [scenario.scenario_hash] * n
+        columns['tx_id'] += [tx.tx_id for tx in txs]
+        columns['from_address'] += from_addrs
+        columns['to_address'] += to_addrs
+        columns['asset_symbol'] += [tx.asset.symbol for tx in txs]
+        columns['chain'] += [tx.asset.chain.name for tx in txs]
+        columns['amount'] += [row.amount for row in rows]
+        columns['fee'] += [str(tx.fee) for tx in txs]
+        columns['timestamp'] += [row.timestamp for row in rows]
+        columns['block_number'] += [tx.block_number for tx in txs]
+        columns['from_role'] += [roles[addr] for addr in from_addrs]
+        columns['to_role'] += [roles[addr] for addr in to_addrs]
+    
+    types = dict.fromkeys(_ARROW_FIELDNAMES, pa.string())
+    types['timestamp'] = pa.timestamp('us')
+    types['block_number'] = pa.int64()
+    schema = pa.schema(
+        [(name, types[name]) for name in _ARROW_FIELDNAMES],
+        metadata={'artificial_data_warning': 'ARTIFICIAL_DATA_DO_NOT_USE_FOR_REAL_CASES'}
+    )
+    return pa.Table.from_arrays(
+        [pa.array(columns[name], type=types[name]) for name in _ARROW_FIELDNAMES],
+        schema=schema
+    )
+
+
+# Export format name -> (file extension, exporter function)
+_EXPORTERS = {
+    'json': ('json', export_json),
+    'csv': ('csv', export_csv_transactions),
+    'md': ('md', export_markdown_narrative),
+}
+
+
+def _export_one(args: Tuple[Scenario, Path, Tuple[str, ...]]) -> List[Path]:
+    """Export a single scenario in each requested format (process pool worker)"""
+    scenario, out_dir, formats = args
+    paths = []
+    for fmt in formats:
+        extension, exporter = _EXPORTERS[fmt]
+        path = out_dir / f"scenario_{scenario.scenario_id}.{extension}"
+        exporter(scenario, path)
+        paths.append(path)
+    return paths
+
+
+def export_many(
+    scenarios: Iterable[Scenario],
+    out_dir: Path,
+    formats: Sequence[str] = ('json', 'csv', 'md'),
+    max_workers: Optional[int] = None
+) -> List[List[Path]]:
+    """
+    Export many scenarios in parallel across processes.
+    
+    Each scenario is written to `out_dir/scenario_<scenario_id>.<ext>` for
+    every requested format. Scenarios are pickled to the worker processes.
+    
+    Args:
+        scenarios: Scenarios to export
+        out_dir: Output directory (created if missing)
+        formats: Any of 'json', 'csv', 'md'
+        max_workers: Worker process count (default: os.cpu_count()); 1 exports
+            in the calling process
+    
+    Returns:
+        Written paths per scenario, in input order
+    """
+    formats = tuple(formats)
+    unknown = [fmt for fmt in formats if fmt not in _EXPORTERS]
+    if unknown:
+        raise ValueError(f"Unsupported export formats: {unknown}")
+    
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [(scenario, out_dir, formats) for scenario in scenarios]
+    
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        return [_export_one(job) for job in jobs]
+    
+    from concurrent.futures import ProcessPoolExecutor  # multiprocessing is slow to import
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_export_one, jobs))
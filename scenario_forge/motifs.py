@@ -7,21 +7,298 @@ specific money laundering techniques. Each motif accepts parameters and
 outputs transactions with annotated AML weaknesses.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
+from array import array
+from collections import namedtuple
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import os
 import random
+import struct
 
 from .primitives import (
     Wallet, Transaction, Asset, Chain, ChainType, Jurisdiction, RegulatoryTier
 )
 
+# Shared Decimal constants (immutable, so safe to reuse across transactions)
+_ZERO = Decimal("0")
+_FEE_BRIDGE = Decimal("0.01")
+_FEE_NFT_TRADE = Decimal("0.01")
+_FEE_MIXER = Decimal("0.005")
+_FEE_TRANSFER = Decimal("0.001")
+_FEE_HFT = Decimal("0.0001")
+
+# Internal base unit for motif amount math (1e-18), fixed rather than taken
+# from asset.decimals so low-decimals assets keep sub-unit fees and splits
+_SCALE = 10 ** 18
+
+# Bytes of entropy per tx_id suffix (one little-endian uint32)
+_ID_WORD_SIZE = 4
+
+# Metadata templates for per-round transactions; copied and the None slot
+# filled in, which keeps key order and is cheaper than a fresh 3-key literal
+_META_MIXER_ENTRY = {'motif': 'mixer_obfuscation', 'type': 'entry', 'round': None}
+_META_MIXER_EXIT = {'motif': 'mixer_obfuscation', 'type': 'exit', 'round': None}
+_META_NFT_FORWARD = {'motif': 'nft_wash_trading', 'round': None, 'direction': 'forward'}
+_META_HFT = {'motif': 'false_positive_trap', 'pattern': 'hft', 'trade': None}
+
+# Address-only stand-in for intermediate wallets (params['lite_wallets'])
+_LiteWallet = namedtuple('_LiteWallet', 'address chain')
+
+# Lightweight transaction record emitted by `generate_subgraph_raw`
+_TxRec = namedtuple('_TxRec', 'tx_id from_addr to_addr amount fee ts hop motif')
+
+
+def _rand_addrs_and_ids(rng: random.Random, n_addrs: int, n_ids: int) -> Tuple[List[str], List[int]]:
+    """
+    Draw hex addresses and tx_id suffixes from a single random buffer.
+    
+    Each address takes 20 bytes and each id suffix one little-endian uint32
+    (see `_ids_from_bytes`).
+    """
+    addr_bytes = 20 * n_addrs
+    raw = rng.randbytes(addr_bytes + _ID_WORD_SIZE * n_ids)
+    hex_str = raw[:addr_bytes].hex()
+    addrs = ["0x" + hex_str[i:i + 40] for i in range(0, 2 * addr_bytes, 40)]
+    return addrs, _ids_from_bytes(raw[addr_bytes:])
+
+
+@lru_cache(maxsize=256)
+def _dec(value: str) -> Decimal:
+    """Parse a decimal string, cached across motif calls (Decimal is immutable)"""
+    return Decimal(value)
+
+
+def _to_units(value) -> int:
+    """Convert an amount to integer base units of `_SCALE`"""
+    return int(_dec(str(value)) * _SCALE)
+
+
+def _exponent(value) -> int:
+    """Decimal exponent of an amount parameter, e.g. -1 for 10.0"""
+    return _dec(str(value)).as_tuple().exponent
+
+
+def _from_units(units: int, exponent: int = 0) -> Decimal:
+    """
+    Convert integer base units back to a Decimal amount.
+    
+    Exact division strips trailing zeros, so the result is quantized back to
+    at least `exponent` places; 500.0 stays "500.0" rather than "500".
+    """
+    amount = Decimal(units) / _SCALE
+    if amount.as_tuple().exponent > exponent:
+        amount = amount.quantize(Decimal(1).scaleb(exponent))
+    return amount
+
+
+def _split_units(total_u: int, parts: int, what: str) -> int:
+    """Split total_u base units evenly, rejecting amounts too small to split"""
+    units = total_u // parts
+    if units <= 0:
+        raise ValueError(f"{what} amount is too small to split into {parts} parts")
+    return units
+
+
+def _peel_fee_units(cost_tolerance_u: int, multipliers: List[float]) -> List[int]:
+    """Per-hop peel fees in base units: cost tolerance scaled by each multiplier"""
+    return [int(cost_tolerance_u * m) for m in multipliers]
+
+
+def _wash_amount_units(base_u: int, rounds: int) -> List[int]:
+    """Wash trade prices base * 1.1 ** i in base units, for i in 0..rounds"""
+    out = []
+    num, den = base_u, 1
+    for _ in range(rounds + 1):
+        out.append(num // den)
+        num *= 11
+        den *= 10
+    return out
+
+
+def _ids_from_bytes(raw: bytes) -> List[int]:
+    """Map each little-endian uint32 word of raw to an integer in [10000, 99999]"""
+    return [10000 + word % 90000 for word in struct.unpack(f'<{len(raw) // _ID_WORD_SIZE}I', raw)]
+
+
+def _rand_ids(rng: random.Random, n: int) -> List[int]:
+    """Draw n integers in [10000, 99999] for tx_id and address suffixes"""
+    return _ids_from_bytes(rng.randbytes(_ID_WORD_SIZE * n))
+
+
+def _rand_uniforms(rng: random.Random, low: float, high: float, n: int) -> List[float]:
+    """Draw n floats in [low, high), as n calls to rng.uniform would"""
+    rand = rng.random
+    span = high - low
+    return [low + span * rand() for _ in range(n)]
+
+
+def _timestamps(start: datetime, hours: List[float]) -> List[datetime]:
+    """Return start followed by start plus each running total of hours"""
+    return [start + timedelta(hours=h) for h in accumulate(hours, initial=0.0)]
+
+
+@dataclass
+class TransactionColumns:
+    """
+    Column-oriented (structure-of-arrays) view of a transaction list.
+    
+    Each column holds one field for every transaction, in input order.
+    Wallets are stored once in `wallets` and referenced by index from
+    `from_idx`/`to_idx`, so scans over amounts, fees or timestamps avoid
+    per-transaction attribute access.
+    """
+    tx_ids: List[str] = field(default_factory=list)
+    amounts: List[Decimal] = field(default_factory=list)
+    fees: List[Decimal] = field(default_factory=list)
+    timestamps: List[datetime] = field(default_factory=list)
+    from_idx: array = field(default_factory=lambda: array('q'))
+    to_idx: array = field(default_factory=lambda: array('q'))
+    wallets: List[Wallet] = field(default_factory=list)
+    assets: List[Asset] = field(default_factory=list)
+    block_numbers: List[int] = field(default_factory=list)
+    metadata: List[Dict] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.tx_ids)
+    
+    def addresses(self) -> List[str]:
+        """Wallet addresses, indexable by `from_idx`/`to_idx`"""
+        return [wallet.address for wallet in self.wallets]
+    
+    def as_transaction_objects(self) -> List[Transaction]:
+        """Rebuild the Transaction objects (for APIs that expect them)"""
+        wallets = self.wallets
+        return [
+            Transaction(
+                tx_id=tx_id,
+                from_wallet=wallets[from_i],
+                to_wallet=wallets[to_i],
+                asset=asset,
+                amount=amount,
+                fee=fee,
+                timestamp=timestamp,
+                block_number=block_number,
+                metadata=metadata
+            )
+            for tx_id, from_i, to_i, asset, amount, fee, timestamp, block_number, metadata in zip(
+                self.tx_ids, self.from_idx, self.to_idx, self.assets, self.amounts,
+                self.fees, self.timestamps, self.block_numbers, self.metadata
+            )
+        ]
+
+
+def to_soa(transactions: List[Transaction]) -> TransactionColumns:
+    """
+    Convert motif output to a column-oriented `TransactionColumns`.
+    
+    Args:
+        transactions: Transactions, e.g. from `generate_subgraph`
+    
+    Returns:
+        TransactionColumns with one entry per transaction
+    """
+    columns = TransactionColumns()
+    wallet_index: Dict[str, int] = {}
+    wallets = columns.wallets
+    
+    def index_of(wallet: Wallet) -> int:
+        i = wallet_index.get(wallet.address)
+        if i is None:
+            i = wallet_index[wallet.address] = len(wallets)
+            wallets.append(wallet)
+        return i
+    
+    columns.tx_ids = [tx.tx_id for tx in transactions]
+    columns.amounts = [tx.amount for tx in transactions]
+    columns.fees = [tx.fee for tx in transactions]
+    columns.timestamps = [tx.timestamp for tx in transactions]
+    columns.from_idx = array('q', [index_of(tx.from_wallet) for tx in transactions])
+    columns.to_idx = array('q', [index_of(tx.to_wallet) for tx in transactions])
+    columns.assets = [tx.asset for tx in transactions]
+    columns.block_numbers = [tx.block_number for tx in transactions]
+    columns.metadata = [tx.metadata for tx in transactions]
+    return columns
+
+
+@dataclass
+class SubgraphContext:
+    """
+    Side outputs of `LaunderingMotif.iter_subgraph`.
+    
+    Filled in while the transaction iterator is consumed; read it after
+    iteration completes.
+    """
+    entity_roles: Dict[str, str] = field(default_factory=dict)
+    aml_weaknesses: List[str] = field(default_factory=list)
+
 
 class LaunderingMotif(ABC):
     """Abstract base class for laundering strategy motifs"""
     
-    @abstractmethod
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Seed for this motif's private random generator; the same
+                seed reproduces the same subgraphs (default: unseeded)
+        """
+        self._rng = random.Random(seed)
+    
+    def spawn(self) -> 'LaunderingMotif':
+        """
+        Create an independent motif of the same type, seeded from this one.
+        
+        Each call advances this motif's generator by one draw, so a seeded
+        motif spawns the same sequence of children.
+        """
+        return type(self)(seed=self._rng.getrandbits(64))
+    
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """Restart this motif's generator, as if constructed with `seed`"""
+        self._rng.seed(seed)
+    
+    def iter_subgraph(
+        self,
+        source_wallet: Wallet,
+        target_wallet: Wallet,
+        asset: Asset,
+        params: Dict,
+        context: SubgraphContext
+    ) -> Iterator[Transaction]:
+        """
+        Stream the transactions of this laundering technique one at a time.
+        
+        Lets callers write transactions out incrementally instead of holding
+        the whole subgraph in memory. This default runs `generate_subgraph`
+        and yields its result, so motifs that only override
+        `generate_subgraph` keep working; the built-in motifs override this
+        method instead.
+        
+        Args:
+            source_wallet: Initial source wallet
+            target_wallet: Final destination wallet
+            asset: Asset being transferred
+            params: Motif-specific parameters
+            context: Receives entity roles and AML weaknesses
+        
+        Yields:
+            Transaction objects in generation order
+        """
+        if type(self).generate_subgraph is LaunderingMotif.generate_subgraph:
+            raise NotImplementedError(
+                f"{type(self).__name__} must override iter_subgraph or generate_subgraph"
+            )
+        transactions, entity_roles, aml_weaknesses = self.generate_subgraph(
+            source_wallet, target_wallet, asset, params
+        )
+        context.entity_roles.update(entity_roles)
+        context.aml_weaknesses.extend(aml_weaknesses)
+        yield from transactions
+    
     def generate_subgraph(
         self,
         source_wallet: Wallet,
@@ -38,13 +315,46 @@ class LaunderingMotif(ABC):
             asset: Asset being transferred
             params: Motif-specific parameters
         
+        Subclasses override either this method or `iter_subgraph`.
+        
         Returns:
             Tuple of:
             - List of Transaction objects
             - Dict mapping wallet addresses to entity roles
             - List of AML weakness strings this motif targets
         """
-        pass
+        context = SubgraphContext()
+        transactions = list(self.iter_subgraph(source_wallet, target_wallet, asset, params, context))
+        return transactions, context.entity_roles, context.aml_weaknesses
+    
+    def generate_subgraph_raw(
+        self,
+        source_wallet: Wallet,
+        target_wallet: Wallet,
+        asset: Asset,
+        params: Dict
+    ) -> Tuple[List[_TxRec], Dict[str, str], List[str]]:
+        """
+        Generate the subgraph as flat `_TxRec` records instead of Transactions.
+        
+        Intended for bulk pipelines that only need ids, endpoints, amounts and
+        timestamps. This default converts `generate_subgraph` output; motifs
+        that can emit records directly override it.
+        
+        Returns:
+            Tuple of (records, entity_roles, aml_weaknesses)
+        """
+        transactions, entity_roles, aml_weaknesses = self.generate_subgraph(
+            source_wallet, target_wallet, asset, params
+        )
+        records = [
+            _TxRec(
+                tx.tx_id, tx.from_wallet.address, tx.to_wallet.address,
+                tx.amount, tx.fee, tx.timestamp, i, tx.metadata.get('motif')
+            )
+            for i, tx in enumerate(transactions)
+        ]
+        return records, entity_roles, aml_weaknesses
 
 
 class PeelChain(LaunderingMotif):
@@ -55,80 +365,88 @@ class PeelChain(LaunderingMotif):
         depth: Number of hops in the chain (default: 5)
         time_variance: Hours between transactions (default: 1-6)
         cost_tolerance: Maximum fee per transaction (default: 0.001)
+        lite_wallets: Represent intermediate wallets by address and chain only (default: False)
     """
     
-    def generate_subgraph(
+    def iter_subgraph(
+        self,
+        source_wallet: Wallet,
+        target_wallet: Wallet,
+        asset: Asset,
+        params: Dict,
+        context: SubgraphContext
+    ) -> Iterator[Transaction]:
+        # Roles (which name every intermediate) and the per-hop random draws
+        # are computed up front; records, wallets and Transactions are built
+        # only as the caller consumes them
+        records, entity_roles, aml_weaknesses = self._plan(source_wallet, target_wallet, asset, params)
+        context.entity_roles.update(entity_roles)
+        context.aml_weaknesses.extend(aml_weaknesses)
+        yield from self._hydrate(
+            records, source_wallet, target_wallet, asset, params.get('lite_wallets', False)
+        )
+    
+    def generate_subgraph_raw(
         self,
         source_wallet: Wallet,
         target_wallet: Wallet,
         asset: Asset,
         params: Dict
-    ) -> Tuple[List[Transaction], Dict[str, str], List[str]]:
+    ) -> Tuple[List[_TxRec], Dict[str, str], List[str]]:
+        records, entity_roles, aml_weaknesses = self._plan(source_wallet, target_wallet, asset, params)
+        return list(records), entity_roles, aml_weaknesses
+    
+    def _plan(
+        self,
+        source_wallet: Wallet,
+        target_wallet: Wallet,
+        asset: Asset,
+        params: Dict
+    ) -> Tuple[Iterator[_TxRec], Dict[str, str], List[str]]:
+        """Draw the chain's randomness and roles; records are generated lazily"""
         depth = params.get('depth', 5)
         time_variance = params.get('time_variance', (1, 6))  # hours
-        cost_tolerance = Decimal(str(params.get('cost_tolerance', 0.001)))
-        total_amount = Decimal(str(params.get('amount', 10.0)))
         
-        transactions = []
+        # Amount math runs in integer base units (see _SCALE)
+        cost_tolerance = params.get('cost_tolerance', 0.001)
+        total_amount = params.get('amount', 10.0)
+        cost_tolerance_u = _to_units(cost_tolerance)
+        total_amount_u = _to_units(total_amount)
+        
         entity_roles = {source_wallet.address: 'source', target_wallet.address: 'destination'}
         
-        # Create intermediate wallets
-        intermediate_wallets = []
-        current_wallet = source_wallet
-        current_time = datetime.now()
-        amount_per_hop = total_amount / Decimal(depth)
-        
-        for i in range(depth - 1):
-            # Create intermediate wallet
-            intermediate_addr = f"0x{''.join(random.choices('0123456789abcdef', k=40))}"
-            intermediate_wallet = Wallet(
-                address=intermediate_addr,
-                chain=asset.chain,
-                jurisdiction=current_wallet.jurisdiction,
-                balance=Decimal("0"),
-                created_at=current_time
-            )
-            intermediate_wallets.append(intermediate_wallet)
+        # Chain of addresses: source, intermediates, target
+        amount_per_hop = _from_units(
+            _split_units(total_amount_u, depth, "PeelChain"), _exponent(total_amount)
+        )
+        hops = max(depth - 1, 0)
+        
+        # One random buffer for intermediate addresses and all tx_id
+        # suffixes; index `hops` is the final hop
+        intermediate_addrs, tx_suffixes = _rand_addrs_and_ids(self._rng, hops, hops + 1)
+        for intermediate_addr in intermediate_addrs:
             entity_roles[intermediate_addr] = 'intermediate_peel'
-            
-            # Create transaction
-            tx_id = f"peel_{i}_{random.randint(10000, 99999)}"
-            fee = cost_tolerance * Decimal(random.uniform(0.5, 1.0))
-            
-            tx = Transaction(
-                tx_id=tx_id,
-                from_wallet=current_wallet,
-                to_wallet=intermediate_wallet,
-                asset=asset,
-                amount=amount_per_hop,
-                fee=fee,
-                timestamp=current_time,
-                block_number=0,
-                metadata={'motif': 'peel_chain', 'hop': i}
-            )
-            
-            transactions.append(tx)
-            
-            # Update balances (simplified - in real scenario, balances would be tracked)
-            current_wallet = intermediate_wallet
-            current_time += timedelta(hours=random.uniform(*time_variance))
+        addrs = [source_wallet.address, *intermediate_addrs, target_wallet.address]
         
-        # Final hop to target
-        final_tx_id = f"peel_final_{random.randint(10000, 99999)}"
-        final_fee = cost_tolerance * Decimal(random.uniform(0.5, 1.0))
+        # Draw the remaining per-hop randomness up front
+        fee_units = _peel_fee_units(cost_tolerance_u, _rand_uniforms(self._rng, 0.5, 1.0, hops + 1))
+        fee_exponent = _exponent(cost_tolerance)
+        fees = [_from_units(u, fee_exponent) for u in fee_units]
+        timestamps = _timestamps(datetime.now(), _rand_uniforms(self._rng, *time_variance, hops))
         
-        final_tx = Transaction(
-            tx_id=final_tx_id,
-            from_wallet=current_wallet,
-            to_wallet=target_wallet,
-            asset=asset,
-            amount=amount_per_hop,
-            fee=final_fee,
-            timestamp=current_time,
-            block_number=0,
-            metadata={'motif': 'peel_chain', 'hop': depth - 1}
+        records = (
+            _TxRec(
+                f"peel_{i}_{tx_suffixes[i]}" if i < hops else f"peel_final_{tx_suffixes[i]}",
+                addrs[i],
+                addrs[i + 1],
+                amount_per_hop,
+                fees[i],
+                timestamps[i],
+                i,
+                'peel_chain'
+            )
+            for i in range(hops + 1)
         )
-        transactions.append(final_tx)
         
         aml_weaknesses = [
             "Transaction clustering gaps",
@@ -136,7 +454,47 @@ class PeelChain(LaunderingMotif):
             "Temporal pattern obfuscation"
         ]
         
-        return transactions, entity_roles, aml_weaknesses
+        return records, entity_roles, aml_weaknesses
+    
+    @staticmethod
+    def _hydrate(
+        records: Iterable[_TxRec],
+        source_wallet: Wallet,
+        target_wallet: Wallet,
+        asset: Asset,
+        lite_wallets: bool = False
+    ) -> Iterator[Transaction]:
+        """Build Transactions (and intermediate wallets) from peel records"""
+        wallets = {source_wallet.address: source_wallet, target_wallet.address: target_wallet}
+        chain = asset.chain
+        jurisdiction = source_wallet.jurisdiction
+        for rec in records:
+            to_wallet = wallets.get(rec.to_addr)
+            if to_wallet is None:
+                # Intermediate wallet, created when it first receives funds
+                if lite_wallets:
+                    to_wallet = _LiteWallet(rec.to_addr, chain)
+                else:
+                    to_wallet = Wallet(
+                        address=rec.to_addr,
+                        chain=chain,
+                        jurisdiction=jurisdiction,
+                        balance=_ZERO,
+                        created_at=rec.ts
+                    )
+                wallets[rec.to_addr] = to_wallet
+            
+            yield Transaction(
+                tx_id=rec.tx_id,
+                from_wallet=wallets[rec.from_addr],
+                to_wallet=to_wallet,
+                asset=asset,
+                amount=rec.amount,
+                fee=rec.fee,
+                timestamp=rec.ts,
+                block_number=0,
+                metadata={'motif': rec.motif, 'hop': rec.hop}
+            )
 
 
 class CrossChainBridge(LaunderingMotif):
@@ -146,42 +504,53 @@ class CrossChainBridge(LaunderingMotif):
     Parameters:
         bridge_chains: List of Chain objects to bridge through (default: auto-generated)
         time_variance: Hours between bridge hops (default: 12-48)
+        lite_wallets: Represent intermediate wallets by address and chain only (default: False)
     """
     
-    def generate_subgraph(
+    def iter_subgraph(
         self,
         source_wallet: Wallet,
         target_wallet: Wallet,
         asset: Asset,
-        params: Dict
-    ) -> Tuple[List[Transaction], Dict[str, str], List[str]]:
+        params: Dict,
+        context: SubgraphContext
+    ) -> Iterator[Transaction]:
         bridge_chains = params.get('bridge_chains', [])
+        lite_wallets = params.get('lite_wallets', False)
         time_variance = params.get('time_variance', (12, 48))
-        amount = Decimal(str(params.get('amount', 10.0)))
+        amount = _dec(str(params.get('amount', 10.0)))
         
-        transactions = []
-        entity_roles = {source_wallet.address: 'source', target_wallet.address: 'destination'}
+        entity_roles = context.entity_roles
+        entity_roles.update({source_wallet.address: 'source', target_wallet.address: 'destination'})
         
         # Create bridge wallets if chains provided
         if bridge_chains:
             current_wallet = source_wallet
-            current_time = datetime.now()
+            jurisdiction = source_wallet.jurisdiction  # inherited by every hop
+            hops = len(bridge_chains)
+            bridge_addrs, tx_suffixes = _rand_addrs_and_ids(self._rng, hops, hops + 1)
+            bridge_tx_ids = [f"bridge_{i}_{n}" for i, n in enumerate(tx_suffixes[:hops])]
+            timestamps = _timestamps(datetime.now(), _rand_uniforms(self._rng, *time_variance, hops))
             
-            for i, bridge_chain in enumerate(bridge_chains):
+            for i, (bridge_chain, bridge_addr) in enumerate(zip(bridge_chains, bridge_addrs)):
+                current_time = timestamps[i]
+                
                 # Create bridge wallet on new chain
-                bridge_addr = f"0x{''.join(random.choices('0123456789abcdef', k=40))}"
-                bridge_wallet = Wallet(
-                    address=bridge_addr,
-                    chain=bridge_chain,
-                    jurisdiction=current_wallet.jurisdiction,
-                    balance=Decimal("0"),
-                    created_at=current_time
-                )
+                if lite_wallets:
+                    bridge_wallet = _LiteWallet(bridge_addr, bridge_chain)
+                else:
+                    bridge_wallet = Wallet(
+                        address=bridge_addr,
+                        chain=bridge_chain,
+                        jurisdiction=jurisdiction,
+                        balance=_ZERO,
+                        created_at=current_time
+                    )
                 entity_roles[bridge_addr] = f'bridge_{i}'
                 
                 # Bridge transaction (simplified - assumes wrapped asset)
-                bridge_tx_id = f"bridge_{i}_{random.randint(10000, 99999)}"
-                bridge_fee = Decimal("0.01")
+                bridge_tx_id = bridge_tx_ids[i]
+                bridge_fee = _FEE_BRIDGE
                 
                 bridge_tx = Transaction(
                     tx_id=bridge_tx_id,
@@ -195,47 +564,44 @@ class CrossChainBridge(LaunderingMotif):
                     metadata={'motif': 'cross_chain_bridge', 'chain': bridge_chain.name}
                 )
                 
-                transactions.append(bridge_tx)
+                yield bridge_tx
                 current_wallet = bridge_wallet
-                current_time += timedelta(hours=random.uniform(*time_variance))
             
             # Final bridge to target
-            final_bridge_tx_id = f"bridge_final_{random.randint(10000, 99999)}"
+            final_bridge_tx_id = f"bridge_final_{tx_suffixes[hops]}"
             final_bridge_tx = Transaction(
                 tx_id=final_bridge_tx_id,
                 from_wallet=current_wallet,
                 to_wallet=target_wallet,
                 asset=asset,
                 amount=amount,
-                fee=Decimal("0.01"),
-                timestamp=current_time,
+                fee=_FEE_BRIDGE,
+                timestamp=timestamps[hops],
                 block_number=0,
                 metadata={'motif': 'cross_chain_bridge', 'final': True}
             )
-            transactions.append(final_bridge_tx)
+            yield final_bridge_tx
         else:
             # Single bridge hop (simplified)
-            bridge_tx_id = f"bridge_{random.randint(10000, 99999)}"
+            bridge_tx_id = f"bridge_{self._rng.randint(10000, 99999)}"
             bridge_tx = Transaction(
                 tx_id=bridge_tx_id,
                 from_wallet=source_wallet,
                 to_wallet=target_wallet,
                 asset=asset,
                 amount=amount,
-                fee=Decimal("0.01"),
+                fee=_FEE_BRIDGE,
                 timestamp=datetime.now(),
                 block_number=0,
                 metadata={'motif': 'cross_chain_bridge'}
             )
-            transactions.append(bridge_tx)
+            yield bridge_tx
         
-        aml_weaknesses = [
+        context.aml_weaknesses.extend([
             "Cross-chain analysis gaps",
             "Bridge correlation weaknesses",
             "Multi-chain jurisdiction arbitrage"
-        ]
-        
-        return transactions, entity_roles, aml_weaknesses
+        ])
 
 
 class MixerObfuscation(LaunderingMotif):
@@ -245,108 +611,139 @@ class MixerObfuscation(LaunderingMotif):
     Parameters:
         mixer_rounds: Number of mixer iterations (default: 3)
         mixer_delay: Hours between mixer entry/exit (default: 24-72)
+        lite_wallets: Represent intermediate wallets by address and chain only (default: False)
     """
     
-    def generate_subgraph(
+    def iter_subgraph(
         self,
         source_wallet: Wallet,
         target_wallet: Wallet,
         asset: Asset,
-        params: Dict
-    ) -> Tuple[List[Transaction], Dict[str, str], List[str]]:
+        params: Dict,
+        context: SubgraphContext
+    ) -> Iterator[Transaction]:
         mixer_rounds = params.get('mixer_rounds', 3)
+        lite_wallets = params.get('lite_wallets', False)
         mixer_delay = params.get('mixer_delay', (24, 72))
-        amount = Decimal(str(params.get('amount', 10.0)))
+        amount_param = params.get('amount', 10.0)
+        amount_u = _to_units(amount_param)
+        amount_exponent = _exponent(amount_param)
+        amount = _from_units(amount_u, amount_exponent)
+        
+        # 3% mixer fee per round, in integer base units; post-fee amounts
+        # carry two more places, as amount * Decimal("0.03") would
+        mixer_fee_u = amount_u * 3 // 100
+        exit_amount = _from_units(amount_u - mixer_fee_u, amount_exponent - 2)
         
-        transactions = []
-        entity_roles = {
+        entity_roles = context.entity_roles
+        entity_roles.update({
             source_wallet.address: 'source',
             target_wallet.address: 'destination'
-        }
+        })
         
         current_wallet = source_wallet
-        current_time = datetime.now()
+        chain = asset.chain
+        jurisdiction = source_wallet.jurisdiction  # inherited by every hop
+        
+        # Draw per-round randomness up front: four id suffixes and two
+        # delays (exit wallet creation, round advance) per round
+        suffixes = _rand_ids(self._rng, 4 * mixer_rounds)
+        entry_addrs = [f"mixer_entry_{i}_{n}" for i, n in enumerate(suffixes[0::4])]
+        entry_tx_ids = [f"mixer_entry_{i}_{n}" for i, n in enumerate(suffixes[1::4])]
+        exit_addrs = [f"mixer_exit_{i}_{n}" for i, n in enumerate(suffixes[2::4])]
+        exit_tx_ids = [f"mixer_exit_{i}_{n}" for i, n in enumerate(suffixes[3::4])]
+        delays = _rand_uniforms(self._rng, *mixer_delay, 2 * mixer_rounds)
+        timestamps = _timestamps(datetime.now(), delays[1::2])
         
         for i in range(mixer_rounds):
+            current_time = timestamps[i]
+            
             # Mixer entry wallet (service wallet)
-            mixer_entry_addr = f"mixer_entry_{i}_{random.randint(10000, 99999)}"
-            mixer_entry = Wallet(
-                address=mixer_entry_addr,
-                chain=asset.chain,
-                jurisdiction=current_wallet.jurisdiction,
-                balance=Decimal("0"),
-                created_at=current_time
-            )
+            mixer_entry_addr = entry_addrs[i]
+            if lite_wallets:
+                mixer_entry = _LiteWallet(mixer_entry_addr, chain)
+            else:
+                mixer_entry = Wallet(
+                    address=mixer_entry_addr,
+                    chain=chain,
+                    jurisdiction=jurisdiction,
+                    balance=_ZERO,
+                    created_at=current_time
+                )
             entity_roles[mixer_entry_addr] = f'mixer_entry_{i}'
             
             # Entry transaction
-            entry_tx_id = f"mixer_entry_{i}_{random.randint(10000, 99999)}"
+            entry_tx_id = entry_tx_ids[i]
+            entry_meta = _META_MIXER_ENTRY.copy()
+            entry_meta['round'] = i
             entry_tx = Transaction(
                 tx_id=entry_tx_id,
                 from_wallet=current_wallet,
                 to_wallet=mixer_entry,
                 asset=asset,
                 amount=amount,
-                fee=Decimal("0.005"),
+                fee=_FEE_MIXER,
                 timestamp=current_time,
                 block_number=0,
-                metadata={'motif': 'mixer_obfuscation', 'type': 'entry', 'round': i}
+                metadata=entry_meta
             )
-            transactions.append(entry_tx)
+            yield entry_tx
             
             # Mixer exit (after delay)
-            mixer_exit_addr = f"mixer_exit_{i}_{random.randint(10000, 99999)}"
-            mixer_exit = Wallet(
-                address=mixer_exit_addr,
-                chain=asset.chain,
-                jurisdiction=current_wallet.jurisdiction,
-                balance=Decimal("0"),
-                created_at=current_time + timedelta(hours=random.uniform(*mixer_delay))
-            )
+            mixer_exit_addr = exit_addrs[i]
+            if lite_wallets:
+                mixer_exit = _LiteWallet(mixer_exit_addr, chain)
+            else:
+                mixer_exit = Wallet(
+                    address=mixer_exit_addr,
+                    chain=chain,
+                    jurisdiction=jurisdiction,
+                    balance=_ZERO,
+                    created_at=current_time + timedelta(hours=delays[2 * i])
+                )
             entity_roles[mixer_exit_addr] = f'mixer_exit_{i}'
             
-            current_time += timedelta(hours=random.uniform(*mixer_delay))
+            current_time = timestamps[i + 1]
             
             # Exit transaction (slightly less due to mixer fees)
-            exit_tx_id = f"mixer_exit_{i}_{random.randint(10000, 99999)}"
-            mixer_fee = amount * Decimal("0.03")  # 3% mixer fee
+            exit_tx_id = exit_tx_ids[i]
+            exit_meta = _META_MIXER_EXIT.copy()
+            exit_meta['round'] = i
             exit_tx = Transaction(
                 tx_id=exit_tx_id,
                 from_wallet=mixer_entry,  # Simplified - real mixers are more complex
                 to_wallet=mixer_exit,
                 asset=asset,
-                amount=amount - mixer_fee,
-                fee=Decimal("0.005"),
+                amount=exit_amount,
+                fee=_FEE_MIXER,
                 timestamp=current_time,
                 block_number=0,
-                metadata={'motif': 'mixer_obfuscation', 'type': 'exit', 'round': i}
+                metadata=exit_meta
             )
-            transactions.append(exit_tx)
+            yield exit_tx
             
             current_wallet = mixer_exit
         
         # Final transfer to target
-        final_tx_id = f"mixer_final_{random.randint(10000, 99999)}"
+        final_tx_id = f"mixer_final_{self._rng.randint(10000, 99999)}"
         final_tx = Transaction(
             tx_id=final_tx_id,
             from_wallet=current_wallet,
             to_wallet=target_wallet,
             asset=asset,
-            amount=amount - (amount * Decimal("0.03") * mixer_rounds),
-            fee=Decimal("0.001"),
-            timestamp=current_time + timedelta(hours=random.uniform(1, 6)),
+            amount=_from_units(amount_u - mixer_fee_u * mixer_rounds, amount_exponent - 2),
+            fee=_FEE_TRANSFER,
+            timestamp=timestamps[mixer_rounds] + timedelta(hours=self._rng.uniform(1, 6)),
             block_number=0,
             metadata={'motif': 'mixer_obfuscation', 'final': True}
         )
-        transactions.append(final_tx)
+        yield final_tx
         
-        aml_weaknesses = [
+        context.aml_weaknesses.extend([
             "Mixer exit correlation gaps",
             "Temporal pattern obfuscation",
             "Transaction graph fragmentation"
-        ]
-        
-        return transactions, entity_roles, aml_weaknesses
+        ])
 
 
 class NFTWashTrading(LaunderingMotif):
@@ -356,84 +753,105 @@ class NFTWashTrading(LaunderingMotif):
     Parameters:
         wash_rounds: Number of circular trades (default: 5)
         time_variance: Hours between trades (default: 6-24)
+        lite_wallets: Represent intermediate wallets by address and chain only (default: False)
     """
     
-    def generate_subgraph(
+    def iter_subgraph(
         self,
         source_wallet: Wallet,
         target_wallet: Wallet,
         asset: Asset,
-        params: Dict
-    ) -> Tuple[List[Transaction], Dict[str, str], List[str]]:
+        params: Dict,
+        context: SubgraphContext
+    ) -> Iterator[Transaction]:
         wash_rounds = params.get('wash_rounds', 5)
+        lite_wallets = params.get('lite_wallets', False)
         time_variance = params.get('time_variance', (6, 24))
-        base_amount = Decimal(str(params.get('amount', 5.0)))
+        base_amount = params.get('amount', 5.0)
+        base_amount_u = _to_units(base_amount)
+        base_exponent = _exponent(base_amount)
         
-        transactions = []
-        entity_roles = {
+        # Escalating prices (10% per round), exact in integer base units
+        trade_amounts = [
+            _from_units(u, base_exponent)
+            for u in _wash_amount_units(base_amount_u, wash_rounds)
+        ]
+        
+        entity_roles = context.entity_roles
+        entity_roles.update({
             source_wallet.address: 'source',
             target_wallet.address: 'destination'
-        }
+        })
         
         current_wallet = source_wallet
-        current_time = datetime.now()
+        chain = asset.chain
+        jurisdiction = source_wallet.jurisdiction  # inherited by every hop
+        
+        # Draw per-round randomness up front (two id suffixes per round)
+        suffixes = _rand_ids(self._rng, 2 * wash_rounds)
+        intermediary_addrs = [f"nft_wash_{i}_{n}" for i, n in enumerate(suffixes[0::2])]
+        trade_tx_ids = [f"nft_wash_{i}_a_{n}" for i, n in enumerate(suffixes[1::2])]
+        timestamps = _timestamps(datetime.now(), _rand_uniforms(self._rng, *time_variance, wash_rounds))
         
         # Create intermediary wallets for circular trades
         for i in range(wash_rounds):
-            intermediary_addr = f"nft_wash_{i}_{random.randint(10000, 99999)}"
-            intermediary = Wallet(
-                address=intermediary_addr,
-                chain=asset.chain,
-                jurisdiction=current_wallet.jurisdiction,
-                balance=Decimal("0"),
-                created_at=current_time
-            )
+            current_time = timestamps[i]
+            intermediary_addr = intermediary_addrs[i]
+            if lite_wallets:
+                intermediary = _LiteWallet(intermediary_addr, chain)
+            else:
+                intermediary = Wallet(
+                    address=intermediary_addr,
+                    chain=chain,
+                    jurisdiction=jurisdiction,
+                    balance=_ZERO,
+                    created_at=current_time
+                )
             entity_roles[intermediary_addr] = f'nft_wash_intermediary_{i}'
             
             # Escalating price (wash trading pattern)
-            trade_amount = base_amount * Decimal(1.1) ** i
+            trade_amount = trade_amounts[i]
             
             # Trade to intermediary
-            trade_tx_id = f"nft_wash_{i}_a_{random.randint(10000, 99999)}"
+            trade_tx_id = trade_tx_ids[i]
+            trade_meta = _META_NFT_FORWARD.copy()
+            trade_meta['round'] = i
             trade_tx = Transaction(
                 tx_id=trade_tx_id,
                 from_wallet=current_wallet,
                 to_wallet=intermediary,
                 asset=asset,
                 amount=trade_amount,
-                fee=Decimal("0.01"),
+                fee=_FEE_NFT_TRADE,
                 timestamp=current_time,
                 block_number=0,
-                metadata={'motif': 'nft_wash_trading', 'round': i, 'direction': 'forward'}
+                metadata=trade_meta
             )
-            transactions.append(trade_tx)
+            yield trade_tx
             
-            current_time += timedelta(hours=random.uniform(*time_variance))
             current_wallet = intermediary
         
         # Final transfer to target (extracted value)
-        final_tx_id = f"nft_wash_final_{random.randint(10000, 99999)}"
-        final_amount = base_amount * Decimal(1.1) ** wash_rounds
+        final_tx_id = f"nft_wash_final_{self._rng.randint(10000, 99999)}"
+        final_amount = trade_amounts[wash_rounds]
         final_tx = Transaction(
             tx_id=final_tx_id,
             from_wallet=current_wallet,
             to_wallet=target_wallet,
             asset=asset,
             amount=final_amount,
-            fee=Decimal("0.01"),
-            timestamp=current_time,
+            fee=_FEE_NFT_TRADE,
+            timestamp=timestamps[wash_rounds],
             block_number=0,
             metadata={'motif': 'nft_wash_trading', 'final': True}
         )
-        transactions.append(final_tx)
+        yield final_tx
         
-        aml_weaknesses = [
+        context.aml_weaknesses.extend([
             "NFT price manipulation detection gaps",
             "Circular trading pattern recognition",
             "Marketplace correlation weaknesses"
-        ]
-        
-        return transactions, entity_roles, aml_weaknesses
+        ])
 
 
 class DormancyCooling(LaunderingMotif):
@@ -442,76 +860,81 @@ class DormancyCooling(LaunderingMotif):
     
     Parameters:
         cooling_period_days: Days to wait between phases (default: 30-90)
+        lite_wallets: Represent intermediate wallets by address and chain only (default: False)
     """
     
-    def generate_subgraph(
+    def iter_subgraph(
         self,
         source_wallet: Wallet,
         target_wallet: Wallet,
         asset: Asset,
-        params: Dict
-    ) -> Tuple[List[Transaction], Dict[str, str], List[str]]:
+        params: Dict,
+        context: SubgraphContext
+    ) -> Iterator[Transaction]:
         cooling_period_days = params.get('cooling_period_days', (30, 90))
-        amount = Decimal(str(params.get('amount', 10.0)))
+        lite_wallets = params.get('lite_wallets', False)
+        amount = _dec(str(params.get('amount', 10.0)))
+        start_time = datetime.now()
         
-        transactions = []
-        entity_roles = {
+        entity_roles = context.entity_roles
+        entity_roles.update({
             source_wallet.address: 'source',
             target_wallet.address: 'destination'
-        }
+        })
         
         # Create intermediate wallet for cooling
-        cooling_addr = f"cooling_{random.randint(10000, 99999)}"
-        cooling_wallet = Wallet(
-            address=cooling_addr,
-            chain=asset.chain,
-            jurisdiction=source_wallet.jurisdiction,
-            balance=Decimal("0"),
-            created_at=datetime.now()
-        )
+        cooling_addr = f"cooling_{self._rng.randint(10000, 99999)}"
+        if lite_wallets:
+            cooling_wallet = _LiteWallet(cooling_addr, asset.chain)
+        else:
+            cooling_wallet = Wallet(
+                address=cooling_addr,
+                chain=asset.chain,
+                jurisdiction=source_wallet.jurisdiction,
+                balance=_ZERO,
+                created_at=start_time
+            )
         entity_roles[cooling_addr] = 'cooling_wallet'
         
         # Initial transfer
-        initial_tx_id = f"cooling_initial_{random.randint(10000, 99999)}"
+        initial_tx_id = f"cooling_initial_{self._rng.randint(10000, 99999)}"
         initial_tx = Transaction(
             tx_id=initial_tx_id,
             from_wallet=source_wallet,
             to_wallet=cooling_wallet,
             asset=asset,
             amount=amount,
-            fee=Decimal("0.001"),
-            timestamp=datetime.now(),
+            fee=_FEE_TRANSFER,
+            timestamp=start_time,
             block_number=0,
             metadata={'motif': 'dormancy_cooling', 'phase': 'deposit'}
         )
-        transactions.append(initial_tx)
+        yield initial_tx
         
         # Cooling period (dormant)
-        cooling_days = random.randint(*cooling_period_days)
-        cooled_time = datetime.now() + timedelta(days=cooling_days)
+        cooling_days = self._rng.randint(*cooling_period_days)
+        cooled_time = start_time + timedelta(days=cooling_days)
         
         # Transfer after cooling
-        cooled_tx_id = f"cooling_exit_{random.randint(10000, 99999)}"
+        cooled_tx_id = f"cooling_exit_{self._rng.randint(10000, 99999)}"
         cooled_tx = Transaction(
             tx_id=cooled_tx_id,
             from_wallet=cooling_wallet,
             to_wallet=target_wallet,
             asset=asset,
             amount=amount,
-            fee=Decimal("0.001"),
+            fee=_FEE_TRANSFER,
             timestamp=cooled_time,
             block_number=0,
             metadata={'motif': 'dormancy_cooling', 'phase': 'withdrawal', 'cooling_days': cooling_days}
         )
-        transactions.append(cooled_tx)
+        yield cooled_tx
         
-        aml_weaknesses = [
+        context.aml_weaknesses.extend([
             "Temporal analysis gaps",
             "Dormancy pattern recognition",
             "Long-term correlation weaknesses"
-        ]
-        
-        return transactions, entity_roles, aml_weaknesses
+        ])
 
 
 class FalsePositiveTrap(LaunderingMotif):
@@ -522,63 +945,108 @@ class FalsePositiveTrap(LaunderingMotif):
         pattern_type: Type of legitimate pattern (default: 'high_frequency_trading')
     """
     
-    def generate_subgraph(
+    def iter_subgraph(
         self,
         source_wallet: Wallet,
         target_wallet: Wallet,
         asset: Asset,
-        params: Dict
-    ) -> Tuple[List[Transaction], Dict[str, str], List[str]]:
+        params: Dict,
+        context: SubgraphContext
+    ) -> Iterator[Transaction]:
         pattern_type = params.get('pattern_type', 'high_frequency_trading')
-        amount = Decimal(str(params.get('amount', 10.0)))
+        amount = _dec(str(params.get('amount', 10.0)))
         
-        transactions = []
-        entity_roles = {
+        entity_roles = context.entity_roles
+        entity_roles.update({
             source_wallet.address: 'legitimate_source',
             target_wallet.address: 'legitimate_destination'
-        }
+        })
         
         if pattern_type == 'high_frequency_trading':
             # High-frequency legitimate trading (looks suspicious but is valid)
             current_time = datetime.now()
             num_trades = 10
+            trade_amount = _from_units(
+                _split_units(_to_units(amount), num_trades, "FalsePositiveTrap"), _exponent(amount)
+            )
+            trade_tx_ids = [f"hft_{i}_{n}" for i, n in enumerate(_rand_ids(self._rng, num_trades))]
             
-            for i in range(num_trades):
-                trade_tx_id = f"hft_{i}_{random.randint(10000, 99999)}"
-                trade_amount = amount / Decimal(num_trades)
+            for i, trade_tx_id in enumerate(trade_tx_ids):
+                trade_meta = _META_HFT.copy()
+                trade_meta['trade'] = i
                 trade_tx = Transaction(
                     tx_id=trade_tx_id,
                     from_wallet=source_wallet if i % 2 == 0 else target_wallet,
                     to_wallet=target_wallet if i % 2 == 0 else source_wallet,
                     asset=asset,
                     amount=trade_amount,
-                    fee=Decimal("0.0001"),
+                    fee=_FEE_HFT,
                     timestamp=current_time + timedelta(minutes=i * 5),
                     block_number=0,
-                    metadata={'motif': 'false_positive_trap', 'pattern': 'hft', 'trade': i}
+                    metadata=trade_meta
                 )
-                transactions.append(trade_tx)
+                yield trade_tx
         else:
             # Default: simple legitimate transfer
-            tx_id = f"legitimate_{random.randint(10000, 99999)}"
+            tx_id = f"legitimate_{self._rng.randint(10000, 99999)}"
             tx = Transaction(
                 tx_id=tx_id,
                 from_wallet=source_wallet,
                 to_wallet=target_wallet,
                 asset=asset,
                 amount=amount,
-                fee=Decimal("0.001"),
+                fee=_FEE_TRANSFER,
                 timestamp=datetime.now(),
                 block_number=0,
                 metadata={'motif': 'false_positive_trap', 'pattern': 'legitimate_transfer'}
             )
-            transactions.append(tx)
+            yield tx
         
-        aml_weaknesses = [
+        context.aml_weaknesses.extend([
             "Pattern-based false positive triggers",
             "Legitimate activity misclassification",
             "Context-agnostic rule-based detection"
-        ]
-        
-        return transactions, entity_roles, aml_weaknesses
+        ])
+
+
+def _generate_one(
+    job: Tuple[LaunderingMotif, Wallet, Wallet, Asset, Dict]
+) -> Tuple[List[Transaction], Dict[str, str], List[str]]:
+    """Run a single motif job on its own spawned motif (process pool worker)"""
+    motif, source_wallet, target_wallet, asset, params = job
+    return motif.generate_subgraph(source_wallet, target_wallet, asset, params)
 
+
+def batch_generate(
+    motif: LaunderingMotif,
+    jobs: Sequence[Tuple[Wallet, Wallet, Asset, Dict]],
+    max_workers: Optional[int] = None,
+    chunksize: int = 64
+) -> List[Tuple[List[Transaction], Dict[str, str], List[str]]]:
+    """
+    Generate many independent motif subgraphs in parallel across processes.
+    
+    Every job runs on its own motif from `motif.spawn()`, so jobs do not
+    replay one random stream, and a seeded motif gives the same results
+    regardless of `max_workers`.
+    
+    Args:
+        motif: Motif to run for every job
+        jobs: (source_wallet, target_wallet, asset, params) tuples
+        max_workers: Worker process count (default: os.cpu_count()); 1 runs
+            in the calling process
+        chunksize: Jobs sent to a worker per round trip
+    
+    Returns:
+        generate_subgraph results, in job order
+    """
+    tasks = [(motif.spawn(), *job) for job in jobs]
+    
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        return [_generate_one(task) for task in tasks]
+    
+    from concurrent.futures import ProcessPoolExecutor  # multiprocessing is slow to import
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_one, tasks, chunksize=chunksize))
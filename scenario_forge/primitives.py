@@ -6,11 +6,14 @@ Defines core financial entities: Wallet, Transaction, Asset, Chain, Jurisdiction
 All primitives enforce basic validity constraints.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
-from typing import Dict, Optional
+from enum import Enum, IntFlag
+from typing import Dict, Iterable, Optional
+
+from .crypto import compute_transaction_hash
 
 
 class ChainType(Enum):
@@ -28,7 +31,44 @@ class RegulatoryTier(Enum):
     UNREGULATED = "UNREGULATED"  # e.g., unregulated jurisdictions
 
 
-@dataclass(frozen=True)
+class MotifKind(IntFlag):
+    """Laundering motif bit flags, one per motif class"""
+    CROSS_CHAIN_BRIDGE = 1
+    PEEL_CHAIN = 2
+    MIXER = 4
+    DORMANCY = 8
+    NFT_WASH = 16
+    FALSE_POSITIVE = 32
+    
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> 'MotifKind':
+        """
+        Build a flag set from motif class names (as in Scenario.motifs_used).
+        
+        Args:
+            names: Motif class names; unknown names are ignored
+        
+        Returns:
+            Union of the named motifs' flags
+        """
+        mask = 0
+        for name in names:
+            mask |= _MOTIF_KIND_BY_NAME.get(name, 0)
+        return cls(mask)
+
+
+# Flag value per motif class name (plain ints, see MotifKind.from_names)
+_MOTIF_KIND_BY_NAME: Dict[str, int] = {
+    'CrossChainBridge': MotifKind.CROSS_CHAIN_BRIDGE.value,
+    'PeelChain': MotifKind.PEEL_CHAIN.value,
+    'MixerObfuscation': MotifKind.MIXER.value,
+    'DormancyCooling': MotifKind.DORMANCY.value,
+    'NFTWashTrading': MotifKind.NFT_WASH.value,
+    'FalsePositiveTrap': MotifKind.FALSE_POSITIVE.value
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Chain:
     """Blockchain representation"""
     name: str
@@ -39,7 +79,7 @@ class Chain:
         return f"{self.name} (chain_id: {self.chain_id})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Jurisdiction:
     """Jurisdictional context"""
     code: str  # ISO 3166-1 alpha-2
@@ -50,7 +90,7 @@ class Jurisdiction:
         return f"{self.name} ({self.code})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Asset:
     """Cryptocurrency asset"""
     symbol: str
@@ -61,7 +101,7 @@ class Asset:
         return f"{self.symbol} on {self.chain.name}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Wallet:
     """Crypto wallet representation"""
     address: str
@@ -69,6 +109,8 @@ class Wallet:
     jurisdiction: Jurisdiction
     balance: Decimal = Decimal("0")
     created_at: datetime = field(default_factory=datetime.now)
+    # Cached identity hash (set once in __post_init__)
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate wallet"""
@@ -76,13 +118,23 @@ class Wallet:
             raise ValueError(f"Wallet balance cannot be negative: {self.balance}")
         if not self.address:
             raise ValueError("Wallet address cannot be empty")
+        # Interned so equal addresses compare by identity
+        address = sys.intern(self.address)
+        object.__setattr__(self, 'address', address)
+        object.__setattr__(self, '_hash', hash((address, self.chain.name, self.chain.chain_id)))
     
     def __hash__(self) -> int:
         """Make wallet hashable for graph operations"""
-        return hash((self.address, self.chain.name, self.chain.chain_id))
+        return self._hash
+    
+    def __reduce__(self):
+        """Pickle by constructor arguments so _hash is recomputed on load"""
+        return (type(self), (self.address, self.chain, self.jurisdiction, self.balance, self.created_at))
     
     def __eq__(self, other) -> bool:
         """Wallet equality based on address and chain"""
+        if other is self:
+            return True
         if not isinstance(other, Wallet):
             return False
         return self.address == other.address and self.chain == other.chain
@@ -95,7 +147,7 @@ class Wallet:
         return self.balance >= (amount + fee)
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Blockchain transaction"""
     tx_id: str
@@ -107,6 +159,8 @@ class Transaction:
     timestamp: datetime = field(default_factory=datetime.now)
     block_number: int = 0
     metadata: Dict = field(default_factory=dict)
+    # Memoized integrity hash (see integrity_hash)
+    _integrity_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate transaction"""
@@ -139,6 +193,18 @@ class Transaction:
     def __str__(self) -> str:
         return f"{self.tx_id[:12]}... {self.amount} {self.asset.symbol} ({self.from_wallet} -> {self.to_wallet})"
     
+    @property
+    def integrity_hash(self) -> str:
+        """
+        SHA-256 hash of `to_dict()`, computed on first access and cached.
+        
+        Transactions are treated as immutable once hashed; mutating fields
+        afterwards does not refresh the cached value.
+        """
+        if self._integrity_hash is None:
+            self._integrity_hash = compute_transaction_hash(self.to_dict())
+        return self._integrity_hash
+    
     def to_dict(self) -> Dict:
         """Convert transaction to dictionary for serialization"""
         return {
@@ -7,15 +7,19 @@ and provides provenance metadata with cryptographic integrity.
 """
 
 import json
+from collections import namedtuple
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
-import networkx as nx
 
-from .primitives import Wallet, Transaction, Jurisdiction
-from .crypto import compute_scenario_hash
+from .primitives import Wallet, Transaction, Jurisdiction, MotifKind
+from .crypto import compute_scenario_hash, HASH_PREFIXES, SUPPORTED_ALGORITHMS
+
+# One transaction edge with its pre-rendered export strings; see
+# Scenario.iter_edge_rows
+EdgeRow = namedtuple('EdgeRow', 'timestamp transaction from_address to_address amount timestamp_str')
 
 
 class ScenarioIntent(Enum):
@@ -30,22 +34,53 @@ class ScenarioIntent(Enum):
 class Scenario:
     """AML scenario with transaction graph, provenance, and integrity hash"""
     
+    __slots__ = (
+        'scenario_id', 'intent', 'jurisdiction_assumptions', 'motifs_used',
+        'created_at', 'hash_algorithm', 'nodes', 'entity_roles',
+        'aml_weaknesses', 'provenance', 'scenario_hash',
+        '_edge_from', '_edge_to', '_edge_tx', '_edge_index',
+        '_edge_amount_str', '_edge_time_str', '_graph', '_narrative_cache', '_dict_version', '_dict_cache',
+        '_edge_cache', '_tx_cache', '_total_amount', '_assets', '_chains',
+        '_hash_entries'
+    )
+    
     def __init__(
         self,
         scenario_id: Optional[str] = None,
         intent: ScenarioIntent = ScenarioIntent.LAUNDERING,
         jurisdiction_assumptions: Optional[List[Jurisdiction]] = None,
         motifs_used: Optional[List[str]] = None,
-        created_at: Optional[datetime] = None
+        created_at: Optional[datetime] = None,
+        hash_algorithm: str = 'sha256'
     ):
+        if hash_algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+        
         self.scenario_id = scenario_id or str(uuid4())
         self.intent = intent
         self.jurisdiction_assumptions = jurisdiction_assumptions or []
         self.motifs_used = motifs_used or []
         self.created_at = created_at or datetime.now()
+        self.hash_algorithm = hash_algorithm
+        
+        # Wallet nodes keyed by address, with 'wallet' and 'role' attributes
+        self.nodes: Dict[str, Dict] = {}
         
-        # Transaction graph (NetworkX DiGraph)
-        self.transaction_graph = nx.DiGraph()
+        # Transaction edges as parallel lists, one entry per (from, to) pair;
+        # _edge_index maps each pair to its position so a later transaction
+        # between the same wallets replaces the earlier one
+        self._edge_from: List[str] = []
+        self._edge_to: List[str] = []
+        self._edge_tx: List[Transaction] = []
+        self._edge_index: Dict[Tuple[str, str], int] = {}
+        
+        # str(amount) and timestamp.isoformat() per edge, formatted once for
+        # the hash payload, the sorted edge cache and the CSV export
+        self._edge_amount_str: List[str] = []
+        self._edge_time_str: List[str] = []
+        
+        # NetworkX view of the nodes and edges, built on first access
+        self._graph = None
         
         # Entity roles mapping
         self.entity_roles: Dict[str, str] = {}
@@ -59,9 +94,36 @@ class Scenario:
             'version': '0.1.0',
             'artificial_data_warning': 'ARTIFICIAL_DATA_DO_NOT_USE_FOR_REAL_CASES'
         }
+        # Only recorded when non-default, so SHA-256 exports keep their format
+        if hash_algorithm != 'sha256':
+            self.provenance['hash_algorithm'] = hash_algorithm
         
         # Integrity hash (computed after transactions are added)
         self.scenario_hash: Optional[str] = None
+        
+        # Memoized narrative as (key, narrative); see generate_narrative
+        self._narrative_cache: Optional[Tuple[Tuple, str]] = None
+        
+        # Edge mutation counter (bumped by add_transactions, the only way to
+        # change edges) and memoized to_dict() transaction rows as
+        # (version, rows); see to_dict_cached
+        self._dict_version = 0
+        self._dict_cache: Optional[Tuple[int, List[Dict]]] = None
+        
+        # Graph edges as (from_addr, to_addr, tx) in edge order, and as
+        # EdgeRow-shaped tuples sorted by timestamp; both are rebuilt by
+        # add_transactions
+        self._edge_cache: List[Tuple[str, str, Transaction]] = []
+        self._tx_cache: List[Tuple[datetime, Transaction, str, str, str, str]] = []
+        
+        # Running aggregates over edge transactions (see get_risk_summary)
+        self._total_amount = Decimal(0)
+        self._assets: set = set()
+        self._chains: set = set()
+        
+        # Integrity-hash transaction entries as (tx_id, source node position,
+        # edge index, entry), kept sorted so ties on tx_id fall back to edge order
+        self._hash_entries: List[Tuple[str, int, int, Dict[str, str]]] = []
     
     def add_transactions(self, transactions: List[Transaction], entity_roles: Dict[str, str], aml_weaknesses: List[str]):
         """
@@ -72,35 +134,41 @@ class Scenario:
             entity_roles: Dict mapping wallet addresses to roles
             aml_weaknesses: List of AML weakness strings
         """
-        # Add wallets as nodes
-        wallets_seen = set()
+        nodes = self.nodes
+        edge_index = self._edge_index
+        edge_tx = self._edge_tx
+        amount_str = self._edge_amount_str
+        time_str = self._edge_time_str
+        overwritten = False
+        
+        # Add wallets as nodes; the first appearance in a batch sets the
+        # node attributes, replacing those from earlier batches
+        batch_nodes = {}
         for tx in transactions:
-            if tx.from_wallet.address not in wallets_seen:
-                self.transaction_graph.add_node(
-                    tx.from_wallet.address,
-                    wallet=tx.from_wallet,
-                    role=entity_roles.get(tx.from_wallet.address, 'unknown')
-                )
-                wallets_seen.add(tx.from_wallet.address)
+            from_addr = tx.from_wallet.address
+            to_addr = tx.to_wallet.address
+            if from_addr not in batch_nodes:
+                batch_nodes[from_addr] = {'wallet': tx.from_wallet, 'role': entity_roles.get(from_addr, 'unknown')}
             
-            if tx.to_wallet.address not in wallets_seen:
-                self.transaction_graph.add_node(
-                    tx.to_wallet.address,
-                    wallet=tx.to_wallet,
-                    role=entity_roles.get(tx.to_wallet.address, 'unknown')
-                )
-                wallets_seen.add(tx.to_wallet.address)
+            if to_addr not in batch_nodes:
+                batch_nodes[to_addr] = {'wallet': tx.to_wallet, 'role': entity_roles.get(to_addr, 'unknown')}
             
             # Add transaction as edge
-            self.transaction_graph.add_edge(
-                tx.from_wallet.address,
-                tx.to_wallet.address,
-                transaction=tx,
-                tx_id=tx.tx_id,
-                amount=str(tx.amount),
-                asset=tx.asset.symbol,
-                timestamp=tx.timestamp.isoformat()
-            )
+            index = edge_index.get((from_addr, to_addr))
+            if index is None:
+                edge_index[from_addr, to_addr] = len(edge_tx)
+                self._edge_from.append(from_addr)
+                self._edge_to.append(to_addr)
+                edge_tx.append(tx)
+                amount_str.append(str(tx.amount))
+                time_str.append(tx.timestamp.isoformat())
+            else:
+                edge_tx[index] = tx
+                amount_str[index] = str(tx.amount)
+                time_str[index] = tx.timestamp.isoformat()
+                overwritten = True
+        nodes.update(batch_nodes)
+        self._graph = None
         
         # Update entity roles
         self.entity_roles.update(entity_roles)
@@ -110,12 +178,114 @@ class Scenario:
             if weakness not in self.aml_weaknesses:
                 self.aml_weaknesses.append(weakness)
         
+        # Refresh edge caches. Edges are ordered as a DiGraph iterates them:
+        # grouped by source wallet in node order, then by insertion
+        node_pos = {addr: i for i, addr in enumerate(nodes)}
+        edge_from = self._edge_from
+        edge_to = self._edge_to
+        order = sorted(range(len(edge_tx)), key=[node_pos[addr] for addr in edge_from].__getitem__)
+        self._edge_cache = [(edge_from[i], edge_to[i], edge_tx[i]) for i in order]
+        if not overwritten:
+            # Every transaction became a new edge: extend the running aggregates
+            added = transactions
+            first_new = len(edge_tx) - len(transactions)
+        else:
+            # Some edges were overwritten: rebuild the aggregates from the edges
+            added = [tx for _, _, tx in self._edge_cache]
+            first_new = 0
+            self._total_amount = Decimal(0)
+            self._assets = set()
+            self._chains = set()
+            self._hash_entries = []
+        self._total_amount += sum([tx.amount for tx in added])
+        self._assets.update([tx.asset.symbol for tx in added])
+        self._chains.update([tx.asset.chain.name for tx in added])
+        self._tx_cache = [
+            (edge_tx[i].timestamp, edge_tx[i], edge_from[i], edge_to[i], amount_str[i], time_str[i])
+            for i in order
+        ]
+        self._tx_cache.sort(key=lambda x: x[0])
+        
+        # Merge entries for the new edges into the already-sorted hash entries
+        hash_entries = self._hash_entries
+        for i in range(first_new, len(edge_tx)):
+            tx = edge_tx[i]
+            hash_entries.append((tx.tx_id, node_pos[edge_from[i]], i, {
+                'tx_id': tx.tx_id,
+                'from': edge_from[i],
+                'to': edge_to[i],
+                'amount': amount_str[i],
+                'asset': tx.asset.symbol,
+                'timestamp': time_str[i]
+            }))
+        hash_entries.sort(key=lambda x: x[:3])
+        
         # Recompute hash after adding transactions
         self.scenario_hash = self.compute_integrity_hash()
+        self._dict_version += 1
+    
+    @property
+    def transaction_graph(self):
+        """
+        NetworkX DiGraph view of the scenario, built on first access.
+        
+        Nodes carry 'wallet' and 'role' attributes; edges carry 'transaction'
+        and 'tx_id'. Internal code reads the flat edge lists instead, so
+        NetworkX is only imported when this view is requested.
+        
+        Returns:
+            networkx.DiGraph (rebuilt after each add_transactions call)
+        """
+        if self._graph is None:
+            import networkx as nx
+            graph = nx.DiGraph()
+            graph.add_nodes_from(self.nodes.items())
+            graph.add_edges_from([
+                (from_addr, to_addr, {'transaction': tx, 'tx_id': tx.tx_id})
+                for from_addr, to_addr, tx in self._edge_cache
+            ])
+            self._graph = graph
+        return self._graph
+    
+    @property
+    def motif_kinds(self) -> MotifKind:
+        """
+        Motifs used, as flags for cheap filtering across many scenarios.
+        
+        Computed from motifs_used on each access, so later edits to that
+        list are reflected.
+        
+        Returns:
+            MotifKind flags for the known names in motifs_used, e.g.
+            `scenario.motif_kinds & MotifKind.MIXER`
+        """
+        return MotifKind.from_names(self.motifs_used)
+    
+    def number_of_nodes(self) -> int:
+        """Number of wallet nodes"""
+        return len(self.nodes)
+    
+    def number_of_edges(self) -> int:
+        """Number of transaction edges"""
+        return len(self._edge_tx)
+    
+    def iter_edge_rows(self) -> Iterator[EdgeRow]:
+        """
+        Iterate over transaction edges in timestamp order (stable for ties).
+        
+        Yields:
+            EdgeRow with the transaction, its endpoints, and the amount and
+            timestamp already rendered as the export strings
+        """
+        return map(EdgeRow._make, self._tx_cache)
     
     def compute_integrity_hash(self) -> str:
         """
-        Compute SHA-256 integrity hash of scenario.
+        Compute integrity hash of scenario.
+        
+        Uses SHA-256 by default. Scenarios created with another
+        `hash_algorithm` get the digest prefixed with the algorithm marker
+        (e.g. 'b3-' for BLAKE3) so consumers can tell the formats apart.
         
         Returns:
             Hexadecimal hash string
@@ -132,26 +302,15 @@ class Scenario:
             'motifs_used': self.motifs_used,
             'entity_roles': self.entity_roles,
             'aml_weaknesses': sorted(self.aml_weaknesses),
-            'transaction_count': len(list(self.transaction_graph.edges()))
+            'transaction_count': len(self._edge_cache)
         }
         
-        # Add transaction data (sorted by tx_id for determinism)
-        transactions_list = []
-        for from_addr, to_addr, data in self.transaction_graph.edges(data=True):
-            tx = data['transaction']
-            transactions_list.append({
-                'tx_id': tx.tx_id,
-                'from': from_addr,
-                'to': to_addr,
-                'amount': str(tx.amount),
-                'asset': tx.asset.symbol,
-                'timestamp': tx.timestamp.isoformat()
-            })
-        
-        transactions_list.sort(key=lambda x: x['tx_id'])
-        scenario_data['transactions'] = transactions_list
+        # Add transaction data (sorted by tx_id for determinism; the entries
+        # are maintained in that order by add_transactions)
+        scenario_data['transactions'] = [entry[3] for entry in self._hash_entries]
         
-        return compute_scenario_hash(scenario_data)
+        digest = compute_scenario_hash(scenario_data, algorithm=self.hash_algorithm)
+        return HASH_PREFIXES.get(self.hash_algorithm, '') + digest
     
     def validate(self) -> tuple[bool, List[str]]:
         """
@@ -163,14 +322,16 @@ class Scenario:
         errors = []
         
         # Check graph is not empty
-        if self.transaction_graph.number_of_nodes() == 0:
+        if not self.nodes:
             errors.append("Scenario graph is empty")
         
-        # Check all transactions have valid timestamps
-        for from_addr, to_addr, data in self.transaction_graph.edges(data=True):
-            tx = data['transaction']
-            if tx.timestamp > datetime.now():
-                errors.append(f"Transaction {tx.tx_id} has future timestamp")
+        # Check all transactions have valid timestamps; the edge cache is
+        # sorted by timestamp, so only scan when the latest one is in the future
+        now = datetime.now()
+        if self._tx_cache and self._tx_cache[-1][0] > now:
+            for from_addr, to_addr, tx in self._edge_cache:
+                if tx.timestamp > now:
+                    errors.append(f"Transaction {tx.tx_id} has future timestamp")
         
         # Check entity roles are present
         if not self.entity_roles:
@@ -189,9 +350,9 @@ class Scenario:
         Returns:
             Dictionary with risk metrics
         """
-        transactions = [data['transaction'] for _, _, data in self.transaction_graph.edges(data=True)]
+        tx_cache = self._tx_cache
         
-        if not transactions:
+        if not tx_cache:
             return {
                 'total_transactions': 0,
                 'entities_involved': 0,
@@ -201,20 +362,16 @@ class Scenario:
                 'unique_chains': []
             }
         
-        timestamps = [tx.timestamp for tx in transactions]
-        time_span = (max(timestamps) - min(timestamps)).total_seconds() / 86400  # days
-        
-        total_amount = sum(tx.amount for tx in transactions)
-        unique_assets = list(set(tx.asset.symbol for tx in transactions))
-        unique_chains = list(set(tx.asset.chain.name for tx in transactions))
+        # Edges are cached sorted by timestamp, so the span is last - first
+        time_span = (tx_cache[-1][0] - tx_cache[0][0]).total_seconds() / 86400  # days
         
         return {
-            'total_transactions': len(transactions),
-            'entities_involved': self.transaction_graph.number_of_nodes(),
+            'total_transactions': len(tx_cache),
+            'entities_involved': len(self.nodes),
             'time_span_days': round(time_span, 2),
-            'total_amount': str(total_amount),
-            'unique_assets': unique_assets,
-            'unique_chains': unique_chains,
+            'total_amount': str(self._total_amount),
+            'unique_assets': list(self._assets),
+            'unique_chains': list(self._chains),
             'aml_weaknesses_count': len(self.aml_weaknesses),
             'motifs_used': self.motifs_used
         }
@@ -226,11 +383,16 @@ class Scenario:
         Returns:
             Dictionary representation
         """
-        transactions = []
-        for from_addr, to_addr, data in self.transaction_graph.edges(data=True):
-            tx = data['transaction']
-            transactions.append(tx.to_dict())
+        return self._as_dict([tx.to_dict() for _, _, tx in self._edge_cache])
+    
+    def _as_dict(self, transactions: List[Dict]) -> Dict:
+        """
+        Build the dictionary representation around the given transaction rows.
         
+        The scenario header is read from the live attributes on every call,
+        and the mutable ones are copied, so the result neither misses nor
+        picks up later changes to them.
+        """
         return {
             'scenario_id': self.scenario_id,
             'intent': self.intent.value,
@@ -243,12 +405,33 @@ class Scenario:
                 }
                 for j in self.jurisdiction_assumptions
             ],
-            'motifs_used': self.motifs_used,
-            'entity_roles': self.entity_roles,
-            'aml_weaknesses': self.aml_weaknesses,
+            'motifs_used': list(self.motifs_used),
+            'entity_roles': dict(self.entity_roles),
+            'aml_weaknesses': list(self.aml_weaknesses),
             'transactions': transactions,
             'scenario_hash': self.scenario_hash,
-            'provenance': self.provenance,
+            'provenance': dict(self.provenance),
             'artificial_data_warning': 'ARTIFICIAL_DATA_DO_NOT_USE_FOR_REAL_CASES'
         }
-
+    
+    def to_dict_cached(self) -> Dict:
+        """
+        Return `to_dict()`, reusing the transaction rows between mutations.
+        
+        Building the transaction rows is the expensive part of `to_dict`, and
+        edges only change through `add_transactions`, which invalidates them.
+        The rows list is shared between calls and must be treated as
+        read-only; like `Transaction.integrity_hash`, it assumes transactions
+        are not modified after being added. The rest of the dict is rebuilt
+        from the live attributes on every call, so changes to public
+        attributes such as `jurisdiction_assumptions` or `intent` are always
+        reflected.
+        
+        Returns:
+            Dictionary representation (a new dict on every call)
+        """
+        cached = self._dict_cache
+        if cached is None or cached[0] != self._dict_version:
+            cached = (self._dict_version, [tx.to_dict() for _, _, tx in self._edge_cache])
+            self._dict_cache = cached
+        return self._as_dict(cached[1])
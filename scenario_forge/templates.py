@@ -3,19 +3,28 @@
 Scenario Templates
 
 5 hard-coded scenario templates that combine motifs to create realistic
-adversarial AML scenarios.
+adversarial AML scenarios. Each template is a `TemplateSpec` in the
+`TEMPLATES` table, built by `build_template`; the template functions are
+thin wrappers kept for the public API.
 """
 
+import os
+import random
+import threading
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type
 
 from .scenario import Scenario, ScenarioIntent
 from .primitives import (
     Wallet, Asset, Chain, ChainType, Jurisdiction, RegulatoryTier
 )
 from .motifs import (
-    PeelChain, CrossChainBridge, MixerObfuscation, NFTWashTrading,
-    DormancyCooling, FalsePositiveTrap
+    LaunderingMotif, PeelChain, CrossChainBridge, MixerObfuscation,
+    NFTWashTrading, DormancyCooling, FalsePositiveTrap, SubgraphContext
 )
 
 
@@ -31,292 +40,382 @@ UK = Jurisdiction(code="GB", name="United Kingdom", regulatory_tier=RegulatoryTi
 SG = Jurisdiction(code="SG", name="Singapore", regulatory_tier=RegulatoryTier.MODERATE)
 KY = Jurisdiction(code="KY", name="Cayman Islands", regulatory_tier=RegulatoryTier.LENIENT)
 
+# Common assets (Asset is frozen, so instances are shared across scenarios)
+ETH_ON_ETHEREUM = Asset(symbol="ETH", chain=ETHEREUM, decimals=18)
+ETH_ON_POLYGON = Asset(symbol="ETH", chain=POLYGON, decimals=18)
 
-def cross_chain_laundering() -> Scenario:
+# Fixed template wallets as address -> (chain, jurisdiction, balance)
+_TEMPLATE_WALLETS = {
+    "0x" + "a" * 40: (ETHEREUM, US, Decimal("100.0")),
+    "0x" + "b" * 40: (POLYGON, SG, Decimal("0")),
+    "0x" + "c" * 40: (ETHEREUM, US, Decimal("500.0")),
+    "0x" + "d" * 40: (ETHEREUM, KY, Decimal("0")),
+    "0x" + "e" * 40: (ETHEREUM, US, Decimal("200.0")),
+    "0x" + "f" * 40: (ARBITRUM, KY, Decimal("0")),
+    "0x" + "1" * 40: (ETHEREUM, US, Decimal("100.0")),
+    "0x" + "2" * 40: (ETHEREUM, SG, Decimal("0")),
+    "0x" + "3" * 40: (ETHEREUM, US, Decimal("50.0")),
+    "0x" + "4" * 40: (ETHEREUM, US, Decimal("50.0"))
+}
+
+
+@lru_cache(maxsize=64)
+def _template_wallet(address: str, created_at: datetime) -> Wallet:
     """
-    Template 1: Cross-chain laundering via bridge + CEX exit
+    Build (or reuse) one of the fixed template wallets.
     
-    Intent: LAUNDERING
-    Motifs: CrossChainBridge, PeelChain
+    Wallet is frozen, so templates invoked with the same `now` (e.g. a batch
+    driver passing one timestamp) share the same Wallet objects.
     """
-    scenario = Scenario(
-        intent=ScenarioIntent.LAUNDERING,
-        jurisdiction_assumptions=[US, SG, KY],
-        motifs_used=['CrossChainBridge', 'PeelChain'],
-        created_at=datetime.now()
-    )
-    
-    # Create source wallet (sanctioned entity)
-    source_addr = "0x" + "a" * 40
-    source_wallet = Wallet(
-        address=source_addr,
-        chain=ETHEREUM,
-        jurisdiction=US,
-        balance=Decimal("100.0"),
-        created_at=datetime.now()
-    )
-    
-    # Create destination wallet (CEX)
-    dest_addr = "0x" + "b" * 40
-    dest_wallet = Wallet(
-        address=dest_addr,
-        chain=POLYGON,
-        jurisdiction=SG,
-        balance=Decimal("0"),
-        created_at=datetime.now()
+    chain, jurisdiction, balance = _TEMPLATE_WALLETS[address]
+    return Wallet(
+        address=address,
+        chain=chain,
+        jurisdiction=jurisdiction,
+        balance=balance,
+        created_at=created_at
     )
+
+
+# Per-thread motif instances, one per motif class (see _shared_motif)
+_LOCAL = threading.local()
+
+
+def _shared_motif(motif_cls: Type[LaunderingMotif], seed: Optional[int] = None) -> LaunderingMotif:
+    """
+    Return this thread's instance of a motif class, creating it on first use.
+    
+    Motifs keep no per-call state besides their random generator, so one
+    instance serves every template build on a thread (or batch worker) and
+    saves creating a motif per step. Instances are per thread so concurrent
+    builds never share a generator, and are dropped when the process id
+    changes so a forked child does not replay its parent's random stream.
+    Seeded requests get a separate instance, reseeded on every call, so a
+    seeded build never fixes the stream of later unseeded ones.
+    """
+    pid = os.getpid()
+    if getattr(_LOCAL, 'pid', None) != pid:
+        _LOCAL.pid = pid
+        _LOCAL.motifs = {}
+    motifs = _LOCAL.motifs
+    key = (motif_cls, seed is not None)
+    motif = motifs.get(key)
+    if motif is None:
+        motif = motifs[key] = motif_cls()
+    if seed is not None:
+        motif.reseed(seed)
+    return motif
+
+
+@dataclass(frozen=True)
+class MotifStep:
+    """One motif application within a template"""
+    motif_cls: Type[LaunderingMotif]
+    source: str  # template wallet address
+    target: str  # template wallet address
+    asset: Asset
+    params: Mapping  # read-only view, passed to the motif as-is on every build
+    # If False, only the step's entity roles and AML weaknesses are kept
+    include_transactions: bool = True
+    
+    def __post_init__(self):
+        if not isinstance(self.params, MappingProxyType):
+            object.__setattr__(self, 'params', MappingProxyType(dict(self.params)))
+
+
+@dataclass(frozen=True)
+class TemplateSpec:
+    """Declarative scenario template: scenario metadata plus motif steps"""
+    intent: ScenarioIntent
+    jurisdictions: Tuple[Jurisdiction, ...]
+    motifs_used: Tuple[str, ...]
+    steps: Tuple[MotifStep, ...]
+
+
+def build_template(
+    spec: TemplateSpec,
+    now: Optional[datetime] = None,
+    seed: Optional[int] = None
+) -> Scenario:
+    """
+    Build a scenario from a template spec.
     
-    # Create asset
-    asset = Asset(symbol="ETH", chain=ETHEREUM, decimals=18)
+    Args:
+        spec: Template to build
+        now: Creation time for the scenario and its wallets (default: current time)
+        seed: Seed for the motif generators, making the random parts
+            reproducible (default: continue the shared motifs' streams)
     
-    # Apply CrossChainBridge motif
-    bridge_motif = CrossChainBridge()
-    bridge_txs, bridge_roles, bridge_weaknesses = bridge_motif.generate_subgraph(
-        source_wallet=source_wallet,
-        target_wallet=dest_wallet,
-        asset=asset,
-        params={
-            'bridge_chains': [POLYGON],
-            'amount': 50.0,
-            'time_variance': (12, 48)
-        }
-    )
+    Returns:
+        Scenario with every step's transactions, roles and weaknesses added
+    """
+    now = now or datetime.now()
+    rng = None if seed is None else random.Random(seed)
     
-    # Apply PeelChain motif for final hops
-    peel_motif = PeelChain()
-    peel_txs, peel_roles, peel_weaknesses = peel_motif.generate_subgraph(
-        source_wallet=dest_wallet,  # Simplified - would use intermediate wallets
-        target_wallet=dest_wallet,
-        asset=Asset(symbol="ETH", chain=POLYGON, decimals=18),
-        params={
-            'depth': 3,
-            'amount': 50.0,
-            'time_variance': (1, 6),
-            'cost_tolerance': 0.001
-        }
+    scenario = Scenario(
+        intent=spec.intent,
+        jurisdiction_assumptions=list(spec.jurisdictions),
+        motifs_used=list(spec.motifs_used),
+        created_at=now
     )
     
-    # Combine transactions (simplified - real implementation would chain motifs properly)
-    all_txs = bridge_txs
-    all_roles = {**bridge_roles, **peel_roles}
-    all_weaknesses = bridge_weaknesses + peel_weaknesses
-    
-    scenario.add_transactions(all_txs, all_roles, all_weaknesses)
+    # Combine motif outputs (simplified - real implementation would chain motifs properly).
+    # Every step streams into the same transaction list and context, so the
+    # roles and weaknesses need no per-step merge
+    all_txs = []
+    context = SubgraphContext()
+    for step in spec.steps:
+        motif = _shared_motif(step.motif_cls, None if rng is None else rng.getrandbits(64))
+        txs = motif.iter_subgraph(
+            _template_wallet(step.source, now),
+            _template_wallet(step.target, now),
+            step.asset,
+            step.params,
+            context
+        )
+        if step.include_transactions:
+            all_txs.extend(txs)
+        else:
+            for _ in txs:  # still run the motif for its roles and weaknesses
+                pass
+    
+    scenario.add_transactions(all_txs, context.entity_roles, context.aml_weaknesses)
     
     return scenario
 
 
-def mixer_ransomware_liquidation() -> Scenario:
+# Template table, keyed by template function name
+TEMPLATES: Dict[str, TemplateSpec] = {
+    # Template 1: Cross-chain laundering via bridge + CEX exit
+    'cross_chain_laundering': TemplateSpec(
+        intent=ScenarioIntent.LAUNDERING,
+        jurisdictions=(US, SG, KY),
+        motifs_used=('CrossChainBridge', 'PeelChain'),
+        steps=(
+            # Sanctioned entity -> CEX
+            MotifStep(
+                CrossChainBridge, "0x" + "a" * 40, "0x" + "b" * 40, ETH_ON_ETHEREUM,
+                {'bridge_chains': (POLYGON,), 'amount': 50.0, 'time_variance': (12, 48)}
+            ),
+            # PeelChain for final hops (simplified - would use intermediate wallets)
+            MotifStep(
+                PeelChain, "0x" + "b" * 40, "0x" + "b" * 40, ETH_ON_POLYGON,
+                {'depth': 3, 'amount': 50.0, 'time_variance': (1, 6), 'cost_tolerance': 0.001},
+                include_transactions=False
+            ),
+        )
+    ),
+    # Template 2: Mixer-based ransomware liquidation
+    'mixer_ransomware_liquidation': TemplateSpec(
+        intent=ScenarioIntent.RANSOMWARE_LIQUIDATION,
+        jurisdictions=(US, KY),
+        motifs_used=('MixerObfuscation', 'DormancyCooling'),
+        steps=(
+            # Ransomware wallet -> exit wallet
+            MotifStep(
+                MixerObfuscation, "0x" + "c" * 40, "0x" + "d" * 40, ETH_ON_ETHEREUM,
+                {'mixer_rounds': 3, 'amount': 500.0, 'mixer_delay': (24, 72)}
+            ),
+        )
+    ),
+    # Template 3: Sanctions evasion via jurisdiction hopping
+    'sanctions_evasion_jurisdiction_hopping': TemplateSpec(
+        intent=ScenarioIntent.SANCTIONS_EVASION,
+        jurisdictions=(US, SG, KY),
+        motifs_used=('CrossChainBridge',),
+        steps=(
+            # Sanctioned entity (US) -> offshore destination, multiple hops
+            MotifStep(
+                CrossChainBridge, "0x" + "e" * 40, "0x" + "f" * 40, ETH_ON_ETHEREUM,
+                {'bridge_chains': (POLYGON, ARBITRUM), 'amount': 200.0, 'time_variance': (24, 72)}
+            ),
+        )
+    ),
+    # Template 4: NFT wash trading for value extraction
+    'nft_wash_trading_extraction': TemplateSpec(
+        intent=ScenarioIntent.LAUNDERING,
+        jurisdictions=(US, SG),
+        motifs_used=('NFTWashTrading',),
+        steps=(
+            MotifStep(
+                NFTWashTrading, "0x" + "1" * 40, "0x" + "2" * 40, ETH_ON_ETHEREUM,
+                {'wash_rounds': 5, 'amount': 100.0, 'time_variance': (6, 24)}
+            ),
+        )
+    ),
+    # Template 5: False positive trap (legitimate behavior that looks illicit)
+    'false_positive_legitimate_pattern': TemplateSpec(
+        intent=ScenarioIntent.FALSE_POSITIVE_TRAP,
+        jurisdictions=(US,),
+        motifs_used=('FalsePositiveTrap',),
+        steps=(
+            # Legitimate trader -> legitimate counterparty
+            MotifStep(
+                FalsePositiveTrap, "0x" + "3" * 40, "0x" + "4" * 40, ETH_ON_ETHEREUM,
+                {'pattern_type': 'high_frequency_trading', 'amount': 50.0}
+            ),
+        )
+    ),
+}
+
+
+def _check_template_names(names: Sequence[str]) -> None:
+    """Raise ValueError for names missing from `TEMPLATES`"""
+    unknown = [name for name in names if name not in TEMPLATES]
+    if unknown:
+        raise ValueError(f"Unknown templates: {unknown}")
+
+
+def _job_seeds(seed: Optional[int], n: int) -> List[int]:
+    """Draw one independent seed per batch job (seed=None draws from the OS)"""
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(n)]
+
+
+def iter_batch(
+    names: Sequence[str],
+    n_per_template: int = 1,
+    now: Optional[datetime] = None,
+    seed: Optional[int] = None
+) -> Iterator[Scenario]:
     """
-    Template 2: Mixer-based ransomware liquidation
+    Lazily build template scenarios one at a time.
     
-    Intent: LAUNDERING (RANSOMWARE_LIQUIDATION)
-    Motifs: MixerObfuscation, DormancyCooling
-    """
-    scenario = Scenario(
-        intent=ScenarioIntent.RANSOMWARE_LIQUIDATION,
-        jurisdiction_assumptions=[US, KY],
-        motifs_used=['MixerObfuscation', 'DormancyCooling'],
-        created_at=datetime.now()
-    )
+    Each scenario is built only when requested, so a consumer that writes
+    and discards them (`for s in iter_batch(...): export_json(s, ...)`) holds
+    one scenario in memory at a time instead of the whole batch.
     
-    # Ransomware wallet
-    ransom_addr = "0x" + "c" * 40
-    ransom_wallet = Wallet(
-        address=ransom_addr,
-        chain=ETHEREUM,
-        jurisdiction=US,
-        balance=Decimal("500.0"),
-        created_at=datetime.now()
-    )
+    Args:
+        names: Template names (keys of `TEMPLATES`)
+        n_per_template: Scenarios to build per name
+        now: Creation time for every scenario (default: current time)
+        seed: Seed for the batch; the same seed builds the same scenarios as
+            `build_batch` (default: unseeded)
     
-    # Exit wallet
-    exit_addr = "0x" + "d" * 40
-    exit_wallet = Wallet(
-        address=exit_addr,
-        chain=ETHEREUM,
-        jurisdiction=KY,
-        balance=Decimal("0"),
-        created_at=datetime.now()
+    Returns:
+        Iterator over scenarios grouped by name, in `names` order
+    """
+    _check_template_names(names)
+    now = now or datetime.now()
+    job_names = [name for name in names for _ in range(n_per_template)]
+    return (
+        build_template(TEMPLATES[name], now, job_seed)
+        for name, job_seed in zip(job_names, _job_seeds(seed, len(job_names)))
     )
+
+
+def _build_one(job: Tuple[str, datetime, int]) -> Scenario:
+    """Build one named template with its own seed (process pool worker)"""
+    name, now, seed = job
+    return build_template(TEMPLATES[name], now, seed)
+
+
+def build_batch(
+    names: Sequence[str],
+    n_per_template: int = 1,
+    now: Optional[datetime] = None,
+    max_workers: Optional[int] = None,
+    chunksize: int = 16,
+    seed: Optional[int] = None
+) -> List[Scenario]:
+    """
+    Build many template scenarios in parallel across processes.
+    
+    All scenarios in the batch share one creation time, so the fixed
+    template wallets are built once per worker and reused. Every job gets
+    its own seed drawn up front, so workers never share a random stream and
+    a seeded batch does not depend on `max_workers` or the process start
+    method. Scenarios are pickled back from the worker processes; use
+    `to_soa` on their transactions for a columnar view.
+    
+    Args:
+        names: Template names (keys of `TEMPLATES`)
+        n_per_template: Scenarios to build per name
+        now: Creation time for every scenario (default: current time)
+        max_workers: Worker process count (default: os.cpu_count()); 1 builds
+            in the calling process
+        chunksize: Scenarios sent to a worker per round trip
+        seed: Seed for the batch (default: unseeded)
+    
+    Returns:
+        Scenarios grouped by name, in `names` order
+    """
+    _check_template_names(names)
     
-    asset = Asset(symbol="ETH", chain=ETHEREUM, decimals=18)
+    now = now or datetime.now()
+    job_names = [name for name in names for _ in range(n_per_template)]
+    jobs = [(name, now, job_seed) for name, job_seed in zip(job_names, _job_seeds(seed, len(job_names)))]
     
-    # Apply MixerObfuscation
-    mixer_motif = MixerObfuscation()
-    mixer_txs, mixer_roles, mixer_weaknesses = mixer_motif.generate_subgraph(
-        source_wallet=ransom_wallet,
-        target_wallet=exit_wallet,
-        asset=asset,
-        params={
-            'mixer_rounds': 3,
-            'amount': 500.0,
-            'mixer_delay': (24, 72)
-        }
-    )
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        return [_build_one(job) for job in jobs]
     
-    scenario.add_transactions(mixer_txs, mixer_roles, mixer_weaknesses)
+    from concurrent.futures import ProcessPoolExecutor  # multiprocessing is slow to import
     
-    return scenario
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_build_one, jobs, chunksize=chunksize))
 
 
-def sanctions_evasion_jurisdiction_hopping() -> Scenario:
+def cross_chain_laundering(now: Optional[datetime] = None) -> Scenario:
     """
-    Template 3: Sanctions evasion via jurisdiction hopping
-    
-    Intent: SANCTIONS_EVASION
-    Motifs: CrossChainBridge (with jurisdiction changes)
-    """
-    scenario = Scenario(
-        intent=ScenarioIntent.SANCTIONS_EVASION,
-        jurisdiction_assumptions=[US, SG, KY],
-        motifs_used=['CrossChainBridge'],
-        created_at=datetime.now()
-    )
+    Template 1: Cross-chain laundering via bridge + CEX exit
     
-    # Sanctioned entity wallet (US)
-    sanctioned_addr = "0x" + "e" * 40
-    sanctioned_wallet = Wallet(
-        address=sanctioned_addr,
-        chain=ETHEREUM,
-        jurisdiction=US,
-        balance=Decimal("200.0"),
-        created_at=datetime.now()
-    )
+    Intent: LAUNDERING
+    Motifs: CrossChainBridge, PeelChain
     
-    # Final destination (offshore)
-    offshore_addr = "0x" + "f" * 40
-    offshore_wallet = Wallet(
-        address=offshore_addr,
-        chain=ARBITRUM,
-        jurisdiction=KY,
-        balance=Decimal("0"),
-        created_at=datetime.now()
-    )
+    Args:
+        now: Creation time for the scenario and its wallets (default: current time)
+    """
+    return build_template(TEMPLATES['cross_chain_laundering'], now)
+
+
+def mixer_ransomware_liquidation(now: Optional[datetime] = None) -> Scenario:
+    """
+    Template 2: Mixer-based ransomware liquidation
     
-    asset = Asset(symbol="ETH", chain=ETHEREUM, decimals=18)
+    Intent: LAUNDERING (RANSOMWARE_LIQUIDATION)
+    Motifs: MixerObfuscation, DormancyCooling
     
-    # Apply CrossChainBridge with multiple hops
-    bridge_motif = CrossChainBridge()
-    bridge_txs, bridge_roles, bridge_weaknesses = bridge_motif.generate_subgraph(
-        source_wallet=sanctioned_wallet,
-        target_wallet=offshore_wallet,
-        asset=asset,
-        params={
-            'bridge_chains': [POLYGON, ARBITRUM],
-            'amount': 200.0,
-            'time_variance': (24, 72)
-        }
-    )
+    Args:
+        now: Creation time for the scenario and its wallets (default: current time)
+    """
+    return build_template(TEMPLATES['mixer_ransomware_liquidation'], now)
+
+
+def sanctions_evasion_jurisdiction_hopping(now: Optional[datetime] = None) -> Scenario:
+    """
+    Template 3: Sanctions evasion via jurisdiction hopping
     
-    scenario.add_transactions(bridge_txs, bridge_roles, bridge_weaknesses)
+    Intent: SANCTIONS_EVASION
+    Motifs: CrossChainBridge (with jurisdiction changes)
     
-    return scenario
+    Args:
+        now: Creation time for the scenario and its wallets (default: current time)
+    """
+    return build_template(TEMPLATES['sanctions_evasion_jurisdiction_hopping'], now)
 
 
-def nft_wash_trading_extraction() -> Scenario:
+def nft_wash_trading_extraction(now: Optional[datetime] = None) -> Scenario:
     """
     Template 4: NFT wash trading for value extraction
     
     Intent: LAUNDERING
     Motifs: NFTWashTrading
-    """
-    scenario = Scenario(
-        intent=ScenarioIntent.LAUNDERING,
-        jurisdiction_assumptions=[US, SG],
-        motifs_used=['NFTWashTrading'],
-        created_at=datetime.now()
-    )
-    
-    # Source wallet
-    source_addr = "0x" + "1" * 40
-    source_wallet = Wallet(
-        address=source_addr,
-        chain=ETHEREUM,
-        jurisdiction=US,
-        balance=Decimal("100.0"),
-        created_at=datetime.now()
-    )
-    
-    # Destination wallet
-    dest_addr = "0x" + "2" * 40
-    dest_wallet = Wallet(
-        address=dest_addr,
-        chain=ETHEREUM,
-        jurisdiction=SG,
-        balance=Decimal("0"),
-        created_at=datetime.now()
-    )
     
-    asset = Asset(symbol="ETH", chain=ETHEREUM, decimals=18)
-    
-    # Apply NFTWashTrading
-    nft_motif = NFTWashTrading()
-    nft_txs, nft_roles, nft_weaknesses = nft_motif.generate_subgraph(
-        source_wallet=source_wallet,
-        target_wallet=dest_wallet,
-        asset=asset,
-        params={
-            'wash_rounds': 5,
-            'amount': 100.0,
-            'time_variance': (6, 24)
-        }
-    )
-    
-    scenario.add_transactions(nft_txs, nft_roles, nft_weaknesses)
-    
-    return scenario
+    Args:
+        now: Creation time for the scenario and its wallets (default: current time)
+    """
+    return build_template(TEMPLATES['nft_wash_trading_extraction'], now)
 
 
-def false_positive_legitimate_pattern() -> Scenario:
+def false_positive_legitimate_pattern(now: Optional[datetime] = None) -> Scenario:
     """
     Template 5: False positive trap (legitimate behavior that looks illicit)
     
     Intent: FALSE_POSITIVE_TRAP
     Motifs: FalsePositiveTrap
-    """
-    scenario = Scenario(
-        intent=ScenarioIntent.FALSE_POSITIVE_TRAP,
-        jurisdiction_assumptions=[US],
-        motifs_used=['FalsePositiveTrap'],
-        created_at=datetime.now()
-    )
-    
-    # Legitimate trading wallet
-    trader_addr = "0x" + "3" * 40
-    trader_wallet = Wallet(
-        address=trader_addr,
-        chain=ETHEREUM,
-        jurisdiction=US,
-        balance=Decimal("50.0"),
-        created_at=datetime.now()
-    )
-    
-    # Legitimate counterparty
-    counterparty_addr = "0x" + "4" * 40
-    counterparty_wallet = Wallet(
-        address=counterparty_addr,
-        chain=ETHEREUM,
-        jurisdiction=US,
-        balance=Decimal("50.0"),
-        created_at=datetime.now()
-    )
     
-    asset = Asset(symbol="ETH", chain=ETHEREUM, decimals=18)
-    
-    # Apply FalsePositiveTrap
-    false_pos_motif = FalsePositiveTrap()
-    false_pos_txs, false_pos_roles, false_pos_weaknesses = false_pos_motif.generate_subgraph(
-        source_wallet=trader_wallet,
-        target_wallet=counterparty_wallet,
-        asset=asset,
-        params={
-            'pattern_type': 'high_frequency_trading',
-            'amount': 50.0
-        }
-    )
-    
-    scenario.add_transactions(false_pos_txs, false_pos_roles, false_pos_weaknesses)
-    
-    return scenario
-
+    Args:
+        now: Creation time for the scenario and its wallets (default: current time)
+    """
+    return build_template(TEMPLATES['false_positive_legitimate_pattern'], now)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Tests for canonical serialization and hashing"""
+
+import copy
+import json
+
+import pytest
+
+from scenario_forge._canonical import serialize_scenario_canonical
+from scenario_forge.crypto import canonical_json_bytes
+
+
+def _payload():
+    """Scenario integrity payload in the shape built by compute_integrity_hash"""
+    return {
+        'scenario_id': 'scénario-1',
+        'intent': 'LAUNDERING',
+        'created_at': '2024-01-02T03:04:05.000006',
+        'jurisdiction_assumptions': [
+            {'code': 'CI', 'name': 'Côte d’Ivoire', 'tier': 'LENIENT'},
+            {'code': 'US', 'name': 'United States', 'tier': 'STRICT'},
+        ],
+        'motifs_used': ['CrossChainBridge', 'PeelChain'],
+        'entity_roles': {'0x' + 'b' * 40: 'destination', '0x' + 'a' * 40: 'sourcé'},
+        'aml_weaknesses': ['cross_chain', 'threshold'],
+        'transaction_count': 2,
+        'transactions': [
+            {
+                'tx_id': f'tx_{i}', 'from': '0x' + 'a' * 40, 'to': '0x' + 'b' * 40,
+                'amount': '2.5', 'asset': 'ETH', 'timestamp': '2024-01-02T03:04:05'
+            }
+            for i in range(2)
+        ],
+    }
+
+
+def _reference(data):
+    """Canonical bytes as defined by the original json.dumps serialization"""
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def test_scenario_serializer_matches_json():
+    payload = _payload()
+    assert serialize_scenario_canonical(payload) == _reference(payload)
+
+
+def _extra_transaction_key(p):
+    p['transactions'][0]['fee'] = '0.1'
+
+
+def _missing_transaction_key(p):
+    del p['transactions'][1]['asset']
+
+
+def _extra_jurisdiction_key(p):
+    p['jurisdiction_assumptions'][0]['regulatory_tier'] = 'LENIENT'
+
+
+def _missing_jurisdiction_key(p):
+    del p['jurisdiction_assumptions'][1]['tier']
+
+
+def _bool_count(p):
+    p['transaction_count'] = True
+
+
+def _string_weaknesses(p):
+    p['aml_weaknesses'] = 'cross_chain'
+
+
+def _int_role_key(p):
+    p['entity_roles'] = {7: 'observer', 3: 'source'}
+
+
+def _float_role_value(p):
+    p['entity_roles']['0x' + 'c' * 40] = 1e16
+
+
+def _mapping_transaction(p):
+    p['transactions'][0] = list(p['transactions'][0].items())
+
+
+@pytest.mark.parametrize('mutate', [
+    _extra_transaction_key, _missing_transaction_key, _extra_jurisdiction_key,
+    _missing_jurisdiction_key, _bool_count, _string_weaknesses, _int_role_key,
+    _float_role_value, _mapping_transaction,
+])
+def test_off_schema_payload_falls_back_to_json(mutate):
+    payload = copy.deepcopy(_payload())
+    mutate(payload)
+    assert serialize_scenario_canonical(payload) is None
+    assert canonical_json_bytes(payload) == _reference(payload)
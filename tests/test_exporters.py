@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Tests for scenario exporters"""
+
+import shutil
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from scenario_forge import (
+    Asset, Chain, ChainType, Jurisdiction, RegulatoryTier, Scenario,
+    ScenarioIntent, Transaction, Wallet, exporters, mixer_ransomware_liquidation
+)
+
+ETHEREUM = Chain(name="Ethereum", chain_id=1, chain_type=ChainType.EVM)
+ETH = Asset(symbol="ETH", chain=ETHEREUM)
+CI = Jurisdiction(code="CI", name="Côte d’Ivoire", regulatory_tier=RegulatoryTier.LENIENT)
+CREATED = datetime(2024, 1, 2, 3, 4, 5, 6)
+
+
+def _scenario(metadata):
+    """Two-transaction scenario with the given transaction metadata"""
+    wallets = [
+        Wallet(address="0x" + c * 40, chain=ETHEREUM, jurisdiction=CI, created_at=CREATED)
+        for c in "abc"
+    ]
+    transactions = [
+        Transaction(
+            tx_id=f"tx_{i}",
+            from_wallet=wallets[i],
+            to_wallet=wallets[i + 1],
+            asset=ETH,
+            amount=Decimal("2.50"),
+            timestamp=CREATED,
+            metadata=metadata
+        )
+        for i in range(2)
+    ]
+    scenario = Scenario(
+        scenario_id="scénario",
+        intent=ScenarioIntent.LAUNDERING,
+        jurisdiction_assumptions=[CI],
+        motifs_used=["PeelChain"],
+        created_at=CREATED
+    )
+    scenario.add_transactions(transactions, {wallets[0].address: "sourcé"}, ["wëakness"])
+    return scenario
+
+
+SCENARIOS = {
+    'template': mixer_ransomware_liquidation,
+    'strings': lambda: _scenario({'motif': 'peel_chain', 'hop': 1, 'final': True, 'note': None}),
+    'floats': lambda: _scenario({'small': 2.5e-7, 'large': 1e16, 'plain': 0.1}),
+    'non_str_keys': lambda: _scenario({1: 'one', 2: 'two'}),
+    'big_int': lambda: _scenario({'units': 1 << 70}),
+    'decimal': lambda: _scenario({'price': Decimal("1.10")}),
+}
+
+
+@pytest.mark.parametrize('indent', [2, None])
+@pytest.mark.parametrize('name', sorted(SCENARIOS))
+def test_export_json_bytes_do_not_depend_on_orjson(tmp_path, monkeypatch, name, indent):
+    pytest.importorskip('orjson')
+    scenario = SCENARIOS[name]()
+    
+    with_orjson = tmp_path / "orjson.json"
+    exporters.export_json(scenario, with_orjson, indent=indent)
+    
+    monkeypatch.setattr(exporters, 'orjson', None)
+    without_orjson = tmp_path / "json.json"
+    exporters.export_json(scenario, without_orjson, indent=indent)
+    
+    assert with_orjson.read_bytes() == without_orjson.read_bytes()
+
+
+def test_exporters_recreate_deleted_output_directory(tmp_path):
+    scenario = mixer_ransomware_liquidation()
+    out_dir = tmp_path / "out"
+    exporters_by_name = {
+        'json': exporters.export_json,
+        'csv': exporters.export_csv_transactions,
+        'md': exporters.export_markdown_narrative,
+    }
+    for extension, export in exporters_by_name.items():
+        export(scenario, out_dir / f"scenario.{extension}")
+    shutil.rmtree(out_dir)
+    for extension, export in exporters_by_name.items():
+        export(scenario, out_dir / f"scenario.{extension}")
+        assert (out_dir / f"scenario.{extension}").exists()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Tests for laundering motifs"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from scenario_forge import (
+    Asset, Chain, ChainType, Jurisdiction, RegulatoryTier, Transaction, Wallet
+)
+from scenario_forge.motifs import (
+    FalsePositiveTrap, LaunderingMotif, MixerObfuscation, NFTWashTrading, PeelChain,
+    SubgraphContext, _ids_from_bytes, batch_generate
+)
+
+ETHEREUM = Chain(name="Ethereum", chain_id=1, chain_type=ChainType.EVM)
+ETH = Asset(symbol="ETH", chain=ETHEREUM)
+US = Jurisdiction(code="US", name="United States", regulatory_tier=RegulatoryTier.STRICT)
+SOURCE, TARGET = (
+    Wallet(address="0x" + c * 40, chain=ETHEREUM, jurisdiction=US, created_at=datetime(2024, 1, 1))
+    for c in "ab"
+)
+
+
+@pytest.mark.parametrize('motif, params, expected', [
+    (PeelChain(), {'amount': 50.0, 'depth': 5}, '10.0'),
+    (PeelChain(), {'amount': 100, 'depth': 4}, '25'),
+    (NFTWashTrading(), {'amount': 100.0, 'wash_rounds': 1}, '100.0'),
+    (MixerObfuscation(), {'amount': 500.0}, '500.0'),
+    (MixerObfuscation(), {'amount': '12.50'}, '12.50'),
+    (FalsePositiveTrap(), {'amount': 50.0}, '5.0'),
+])
+def test_amounts_keep_the_parameter_exponent(motif, params, expected):
+    transactions, _, _ = motif.generate_subgraph(SOURCE, TARGET, ETH, params)
+    assert str(transactions[0].amount) == expected
+
+
+def test_mixer_exit_amounts_keep_fee_precision():
+    transactions, _, _ = MixerObfuscation().generate_subgraph(SOURCE, TARGET, ETH, {'amount': 500.0})
+    assert {str(tx.amount) for tx in transactions} == {'500.0', '485.000', '455.000'}
+
+
+def _tx_ids(results):
+    return [[tx.tx_id for tx in transactions] for transactions, _, _ in results]
+
+
+def test_batch_generate_does_not_depend_on_max_workers():
+    jobs = [(SOURCE, TARGET, ETH, {'amount': 10.0, 'depth': 3})] * 4
+    inline, pooled = PeelChain(seed=7), PeelChain(seed=7)
+    
+    assert _tx_ids(batch_generate(inline, jobs, max_workers=1)) == _tx_ids(
+        batch_generate(pooled, jobs, max_workers=2)
+    )
+    # The caller's motif advanced identically on both paths
+    follow_up = [inline.generate_subgraph(*jobs[0]), pooled.generate_subgraph(*jobs[0])]
+    assert _tx_ids(follow_up[:1]) == _tx_ids(follow_up[1:])
+
+
+def test_tx_id_suffixes_use_little_endian_words():
+    raw = (1).to_bytes(4, 'little') + (90001).to_bytes(4, 'little')
+    assert _ids_from_bytes(raw) == [10001, 10001]
+
+
+class _DirectTransfer(LaunderingMotif):
+    """Motif written against the original API: overrides generate_subgraph only"""
+    
+    def generate_subgraph(self, source_wallet, target_wallet, asset, params):
+        tx = Transaction(
+            tx_id="direct_1", from_wallet=source_wallet, to_wallet=target_wallet,
+            asset=asset, amount=params['amount']
+        )
+        return [tx], {source_wallet.address: 'source'}, ["Direct transfer"]
+
+
+def test_motif_overriding_only_generate_subgraph_still_works():
+    motif = _DirectTransfer()
+    context = SubgraphContext()
+    transactions = list(motif.iter_subgraph(SOURCE, TARGET, ETH, {'amount': 1}, context))
+    
+    assert [tx.tx_id for tx in transactions] == ["direct_1"]
+    assert context.entity_roles == {SOURCE.address: 'source'}
+    assert context.aml_weaknesses == ["Direct transfer"]
+
+
+def test_motif_overriding_neither_method_raises():
+    class Empty(LaunderingMotif):
+        pass
+    
+    with pytest.raises(NotImplementedError):
+        Empty().generate_subgraph(SOURCE, TARGET, ETH, {})
+
+
+def test_peel_chain_builds_transactions_lazily():
+    context = SubgraphContext()
+    transactions = PeelChain().iter_subgraph(SOURCE, TARGET, ETH, {'depth': 4}, context)
+    
+    first = next(transactions)
+    assert first.from_wallet is SOURCE
+    assert len(context.entity_roles) == 5
+    assert len(list(transactions)) == 3
+
+
+@pytest.mark.parametrize('decimals', [0, 2, 6])
+@pytest.mark.parametrize('motif, params', [
+    (PeelChain(), {'amount': 1, 'depth': 4}),
+    (MixerObfuscation(), {'amount': 0.3333}),
+    (FalsePositiveTrap(), {'amount': 0.15}),
+    (FalsePositiveTrap(), {'amount': 1e-7}),
+])
+def test_amounts_do_not_depend_on_asset_decimals(motif, params, decimals):
+    asset = Asset(symbol="LOW", chain=ETHEREUM, decimals=decimals)
+    transactions, _, _ = motif.generate_subgraph(SOURCE, TARGET, asset, params)
+    reference, _, _ = type(motif)(seed=0).generate_subgraph(SOURCE, TARGET, ETH, params)
+    assert [tx.amount for tx in transactions] == [tx.amount for tx in reference]
+    assert all(tx.amount > 0 for tx in transactions)
+
+
+def test_peel_fees_keep_sub_unit_precision():
+    asset = Asset(symbol="LOW", chain=ETHEREUM, decimals=2)
+    transactions, _, _ = PeelChain().generate_subgraph(SOURCE, TARGET, asset, {'amount': 10.0})
+    assert all(Decimal("0.0005") <= tx.fee < Decimal("0.001") for tx in transactions)
+
+
+def test_peel_chain_rejects_amount_too_small_to_split():
+    with pytest.raises(ValueError, match="too small to split"):
+        PeelChain().generate_subgraph(SOURCE, TARGET, ETH, {'amount': '3E-18', 'depth': 4})
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Tests for core primitives"""
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from scenario_forge import Chain, ChainType, Jurisdiction, RegulatoryTier, Wallet
+
+ETHEREUM = Chain(name="Ethereum", chain_id=1, chain_type=ChainType.EVM)
+US = Jurisdiction(code="US", name="United States", regulatory_tier=RegulatoryTier.STRICT)
+WALLET_ARGS = dict(address="0x" + "a" * 40, chain=ETHEREUM, jurisdiction=US, created_at=datetime(2024, 1, 1))
+
+
+def test_wallet_pickle_round_trip():
+    wallet = Wallet(**WALLET_ARGS)
+    loaded = pickle.loads(pickle.dumps(wallet))
+    assert loaded == wallet
+    assert hash(loaded) == hash(wallet)
+    assert loaded.created_at == wallet.created_at
+
+
+def test_wallet_from_spawned_process_hashes_like_a_local_one():
+    # A spawned child has its own str hash salt, so a pickled hash would be stale
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        remote = executor.submit(Wallet, **WALLET_ARGS).result()
+    local = Wallet(**WALLET_ARGS)
+    assert hash(remote) == hash(local)
+    assert remote in {local}
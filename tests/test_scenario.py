@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Tests for the Scenario class"""
+
+from scenario_forge import (
+    Jurisdiction, MotifKind, RegulatoryTier, Scenario, ScenarioIntent,
+    mixer_ransomware_liquidation
+)
+from scenario_forge.narrative import _render_narrative, generate_narrative
+
+JP = Jurisdiction(code="JP", name="Japan", regulatory_tier=RegulatoryTier.STRICT)
+
+
+def test_to_dict_cached_reflects_public_attribute_changes():
+    scenario = mixer_ransomware_liquidation()
+    before = scenario.to_dict_cached()
+    
+    scenario.jurisdiction_assumptions.append(JP)
+    scenario.intent = ScenarioIntent.TAX_EVASION
+    scenario.motifs_used.append('PeelChain')
+    scenario.entity_roles['0x' + '9' * 40] = 'observer'
+    
+    after = scenario.to_dict_cached()
+    assert after == scenario.to_dict()
+    assert len(after['jurisdiction_assumptions']) == len(before['jurisdiction_assumptions']) + 1
+    assert after['intent'] == 'TAX_EVASION'
+    
+    # The earlier result is a snapshot, not a live view
+    assert before['intent'] == 'RANSOMWARE_LIQUIDATION'
+    assert 'PeelChain' not in before['motifs_used']
+    assert '0x' + '9' * 40 not in before['entity_roles']
+
+
+def test_to_dict_cached_refreshes_after_add_transactions():
+    scenario = mixer_ransomware_liquidation()
+    rows = scenario.to_dict_cached()['transactions']
+    assert scenario.to_dict_cached()['transactions'] is rows
+    
+    extra = mixer_ransomware_liquidation()
+    extra_txs = [data['transaction'] for _, _, data in extra.transaction_graph.edges(data=True)]
+    scenario.add_transactions(extra_txs, {}, [])
+    assert scenario.to_dict_cached() == scenario.to_dict()
+    assert len(scenario.to_dict_cached()['transactions']) > len(rows)
+
+
+def test_iter_edge_rows_follows_timestamp_order():
+    scenario = mixer_ransomware_liquidation()
+    rows = list(scenario.iter_edge_rows())
+    
+    assert len(rows) == scenario.number_of_edges()
+    assert [row.timestamp for row in rows] == sorted(row.timestamp for row in rows)
+    for row in rows:
+        assert row.transaction.timestamp == row.timestamp
+        assert row.amount == str(row.transaction.amount)
+        assert row.timestamp_str == row.timestamp.isoformat()
+        assert scenario.transaction_graph.has_edge(row.from_address, row.to_address)
+
+
+def test_generate_narrative_reflects_public_attribute_changes():
+    scenario = mixer_ransomware_liquidation()
+    before = generate_narrative(scenario)
+    assert generate_narrative(scenario) is before
+    
+    scenario.intent = ScenarioIntent.TAX_EVASION
+    scenario.aml_weaknesses.append('Unmonitored OTC desks')
+    scenario.motifs_used.append('PeelChain')
+    
+    after = generate_narrative(scenario)
+    assert after == _render_narrative(scenario)
+    assert '**Intent:** TAX_EVASION' in after
+    assert 'Unmonitored OTC desks' in after
+    assert 'Unmonitored OTC desks' not in before
+
+
+def test_motif_kinds_follows_motifs_used():
+    scenario = mixer_ransomware_liquidation()
+    assert not scenario.motif_kinds & MotifKind.PEEL_CHAIN
+    
+    scenario.motifs_used.append('PeelChain')
+    assert scenario.motif_kinds == MotifKind.from_names(scenario.motifs_used)
+    assert scenario.motif_kinds & MotifKind.PEEL_CHAIN
+
+
+def test_narrative_covers_motifs_added_after_construction():
+    scenario = mixer_ransomware_liquidation()
+    assert 'peel chains' not in generate_narrative(scenario)
+    
+    scenario.motifs_used.append('PeelChain')
+    narrative = generate_narrative(scenario)
+    assert 'peel chains' in narrative
+    assert '**Small amount thresholds**' in narrative
+
+
+def test_provenance_records_only_non_default_hash_algorithm():
+    assert 'hash_algorithm' not in Scenario().provenance
+    assert Scenario(hash_algorithm='blake2b').provenance['hash_algorithm'] == 'blake2b'
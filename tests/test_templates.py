@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Tests for scenario templates"""
+
+import threading
+from datetime import datetime
+
+from scenario_forge import build_batch, iter_batch
+from scenario_forge.motifs import PeelChain
+from scenario_forge.templates import _shared_motif
+
+NAMES = ['mixer_ransomware_liquidation', 'nft_wash_trading_extraction', 'false_positive_legitimate_pattern']
+NOW = datetime(2024, 1, 1)
+
+
+def _tx_ids(scenarios):
+    return [sorted(row.transaction.tx_id for row in s.iter_edge_rows()) for s in scenarios]
+
+
+def test_seeded_batch_does_not_depend_on_max_workers():
+    inline = build_batch(NAMES, n_per_template=2, now=NOW, max_workers=1, seed=11)
+    pooled = build_batch(NAMES, n_per_template=2, now=NOW, max_workers=2, seed=11)
+    lazy = iter_batch(NAMES, n_per_template=2, now=NOW, seed=11)
+    assert _tx_ids(inline) == _tx_ids(pooled) == _tx_ids(lazy)
+
+
+def test_batch_jobs_draw_independent_streams():
+    first, second = build_batch(NAMES[:1], n_per_template=2, now=NOW, max_workers=2, seed=11)
+    assert _tx_ids([first]) != _tx_ids([second])
+
+
+def test_seeded_builds_reuse_one_motif_per_thread():
+    seeded = _shared_motif(PeelChain, 1)
+    assert _shared_motif(PeelChain, 2) is seeded
+    assert _shared_motif(PeelChain) is not seeded
+    
+    other_thread = []
+    worker = threading.Thread(target=lambda: other_thread.append(_shared_motif(PeelChain, 1)))
+    worker.start()
+    worker.join()
+    assert other_thread[0] is not seeded